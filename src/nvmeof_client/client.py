@@ -9,9 +9,11 @@ References:
 - NVMe Base Specification Revision 2.2
 """
 
+import functools
 import select
 import socket
 import struct
+import threading
 import time
 import logging
 import uuid
@@ -86,6 +88,7 @@ from .protocol import (
     pack_keep_alive_command,
     pack_nvme_command,
     pack_nvme_compare_command,
+    pack_nvme_data_command,
     pack_nvme_flush_command,
     pack_nvme_read_command,
     pack_nvme_reservation_acquire_command,
@@ -104,6 +107,31 @@ from .protocol import (
 )
 
 
+# Valid reservation action/type values as bitmasks (bit N set = value N allowed)
+_VALID_REGISTER_ACTIONS = (
+    (1 << ReservationAction.REGISTER) | (1 << ReservationAction.UNREGISTER) | (1 << ReservationAction.REPLACE)
+)
+_VALID_ACQUIRE_ACTIONS = (
+    (1 << ReservationAction.ACQUIRE) | (1 << ReservationAction.PREEMPT) | (1 << ReservationAction.PREEMPT_AND_ABORT)
+)
+_VALID_RELEASE_ACTIONS = (1 << ReservationAction.RELEASE) | (1 << ReservationAction.CLEAR)
+_VALID_RESERVATION_TYPES = sum(1 << t for t in ReservationType)
+
+
+def _in_bitmask(value: int, mask: int) -> bool:
+    """Return True if bit ``value`` is set in ``mask``; non-int and negative values are never valid."""
+    return isinstance(value, int) and value >= 0 and bool((mask >> value) & 1)
+
+
+def _io_queue_command(method):
+    """Serialize an I/O queue command so threads sharing a client do not interleave PDUs."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._io_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class NVMeoFClient:
     """
     NVMe over Fabrics TCP Client
@@ -159,7 +187,6 @@ class NVMeoFClient:
 
         # Connection parameters - negotiated during connection setup
         self._max_data_size = 4096  # Maximum data transfer size
-        self._queue_depth = 32      # Maximum outstanding commands
         self._controller_pda = 0    # Controller PDU Data Alignment
         self._digest_types = 0      # Digest types supported
 
@@ -168,6 +195,9 @@ class NVMeoFClient:
         # Reference: NVMe Base Specification Section 5.2.13.2.1, Figure 328
         # Note: Value is in 16-byte units. Minimum is 4 (= 64 bytes). Multiply by 16 to get bytes.
         self._ioccsz = 0
+        # MAXCMD: Maximum outstanding commands per I/O queue (bytes 514-515 from Identify Controller),
+        # 0 if not reported. Reference: NVMe Base Specification Section 5.2.13.2.1, Figure 328
+        self._maxcmd = 0
         # MAXH2CDATA: Maximum H2C_DATA transfer length per PDU in bytes (from ICRESP)
         # Reference: NVMe-oF TCP Transport Specification Rev 1.2, Section 3.6.2.3, Figure 27
         self._maxh2cdata = 0
@@ -180,8 +210,9 @@ class NVMeoFClient:
         self._namespace_info_cache: dict[int, dict[str, Any]] = {}  # Cache namespace info by NSID
 
         # I/O queue tracking
+        self._io_lock = threading.RLock()  # Held for each I/O queue command (send through completion)
         self._io_queues_setup = False  # Track if I/O queues are established
-        self._io_queue_size = 64       # Default I/O queue size (1-based)
+        self._io_queue_size = 64       # I/O submission queue entries (1-based), set by setup_io_queues()
         self._controller_id = None     # Controller ID assigned by target
 
         # Asynchronous event tracking
@@ -244,15 +275,15 @@ class NVMeoFClient:
             elapsed = time.time() - start_time
             self._logger.info(f"Connected to target in {elapsed:.2f} seconds")
 
-        except socket.timeout:
+        except socket.timeout as e:
             self._cleanup_socket()
-            raise NVMeoFTimeoutError(f"Connection timeout after {self.timeout} seconds")
-        except socket.error as e:
+            raise NVMeoFTimeoutError(f"Connection timeout after {self.timeout} seconds") from e
+        except OSError as e:
             self._cleanup_socket()
-            raise NVMeoFConnectionError(f"TCP connection failed: {e}")
+            raise NVMeoFConnectionError(f"TCP connection failed: {e}") from e
         except Exception as e:
             self._cleanup_socket()
-            raise NVMeoFConnectionError(f"Connection initialization failed: {e}")
+            raise NVMeoFConnectionError(f"Connection initialization failed: {e}") from e
 
     def disconnect(self) -> None:
         """
@@ -321,15 +352,15 @@ class NVMeoFClient:
         cmd_timeout = timeout or self.timeout
 
         try:
-            self._logger.debug(f"Sending command {command_id}: opcode={opcode:02x}, nsid={nsid}")
+            self._logger.debug("Sending command %d: opcode=%02x, nsid=%d", command_id, opcode, nsid)
 
             # Build and send command PDU
             self._send_command_pdu(opcode, command_id, nsid, data)
 
-            # Receive and parse response
+            # Receive and parse response (raises CommandError, formatted only on failure)
             response = self._receive_response(command_id, cmd_timeout)
 
-            self._logger.debug(f"Command {command_id} completed successfully")
+            self._logger.debug("Command %d completed successfully", command_id)
             return response
 
         except Exception as e:
@@ -1194,7 +1225,7 @@ class NVMeoFClient:
                 f"ANA log page header too short: got {len(header_data)} bytes, need 16")
 
         # Bytes 8-9: Number of ANA Group Descriptors (16-bit LE)
-        num_descriptors = struct.unpack('<H', header_data[8:10])[0]
+        num_descriptors = int.from_bytes(header_data[8:10], 'little')
 
         self._logger.debug("ANA log page has %d group descriptors", num_descriptors)
 
@@ -1221,13 +1252,19 @@ class NVMeoFClient:
 
         return ana_log
 
-    def get_ana_state(self) -> dict[int, ANAState]:
+    def get_ana_state(self, ana_log: ANALogPage | None = None) -> dict[int, ANAState]:
         """
         Get simplified ANA state mapping for all ANA Groups.
 
         Returns a dictionary mapping ANA Group ID to ANA State, providing
         a quick overview of the accessibility state of each ANA Group.
 
+        Args:
+            ana_log: Previously retrieved ANA log page to derive states from.
+                     If None, the log page is fetched from the controller.
+                     Passing a log page avoids a second Get Log Page command and
+                     guarantees the mapping matches that snapshot.
+
         Returns:
             Dictionary mapping ana_group_id -> ANAState
 
@@ -1242,13 +1279,10 @@ class NVMeoFClient:
             Group 1: OPTIMIZED
             Group 2: INACCESSIBLE
         """
-        ana_log = self.get_ana_log_page()
-
-        state_map = {}
-        for group in ana_log.groups:
-            state_map[group.ana_group_id] = group.ana_state
+        if ana_log is None:
+            ana_log = self.get_ana_log_page()
 
-        return state_map
+        return {group.ana_group_id: group.ana_state for group in ana_log.groups}
 
     def get_changed_namespace_list(self) -> list[int]:
         """
@@ -1302,6 +1336,7 @@ class NVMeoFClient:
 
         return changed_nsids
 
+    @_io_queue_command
     def setup_io_queues(self, queue_size: int = 127) -> None:
         """
         Set up I/O queues for data operations.
@@ -1330,13 +1365,14 @@ class NVMeoFClient:
             return
 
         try:
-            # Get IOCCSZ from Identify Controller data for R2T flow calculations
-            # Reference: NVMe Base Specification Section 5.2.13.2.1, Figure 328, bytes 1792-1795
+            # Get IOCCSZ (R2T flow calculations) and MAXCMD (pipelining limit) from Identify Controller data
+            # Reference: NVMe Base Specification Section 5.2.13.2.1, Figure 328, bytes 1792-1795 and 514-515
             if self._ioccsz == 0:
                 controller_data = self.identify_controller()
                 self._ioccsz = controller_data.get('ioccsz', 0)
-                self._logger.debug("Retrieved IOCCSZ: %d (in 16-byte units = %d bytes)",
-                                   self._ioccsz, self._ioccsz * 16)
+                self._maxcmd = controller_data.get('maxcmd', 0)
+                self._logger.debug("Retrieved IOCCSZ: %d (in 16-byte units = %d bytes), MAXCMD: %d",
+                                   self._ioccsz, self._ioccsz * 16, self._maxcmd)
 
             self._logger.debug("Creating I/O queues for NVMe-oF TCP using separate connection...")
 
@@ -1401,12 +1437,14 @@ class NVMeoFClient:
 
             # Mark I/O queues as set up
             self._io_queues_setup = True
+            self._io_queue_size = queue_size + 1
             self._logger.info(f"I/O queues created successfully (Queue ID {queue_id}, {queue_size + 1} entries)")
 
         except Exception as e:
             self._logger.error(f"I/O queue setup failed: {e}")
             raise
 
+    @_io_queue_command
     def cleanup_io_queues(self) -> None:
         """
         Clean up I/O queues.
@@ -1442,6 +1480,7 @@ class NVMeoFClient:
             # Set flag anyway to avoid repeated cleanup attempts
             self._io_queues_setup = False
 
+    @_io_queue_command
     def read_data(self, nsid: int, lba: int, block_count: int) -> bytes:
         """
         Read data from specified namespace.
@@ -1549,6 +1588,7 @@ class NVMeoFClient:
             self._logger.error(f"Read operation failed: {e}")
             raise
 
+    @_io_queue_command
     def write_data(self, nsid: int, lba: int, data: bytes) -> None:
         """
         Write data to specified namespace.
@@ -1661,6 +1701,124 @@ class NVMeoFClient:
             self._logger.error("Write operation failed: %s", e)
             raise
 
+    @_io_queue_command
+    def write_data_batch(self, nsid: int, writes: list[tuple[int, bytes]]) -> None:
+        """
+        Write several LBA ranges to a namespace with pipelined commands.
+
+        Writes that fit inline in the command capsule are submitted back-to-back,
+        up to the I/O queue depth, before their completions are collected, so a batch
+        costs one network round-trip per window instead of one per write.
+        Writes larger than the inline data size use write_data() (R2T flow).
+
+        Writes take effect in list order: NVMe does not order commands that are
+        outstanding together, so a window is completed before an R2T write or a
+        write that overlaps an LBA range already in the window is issued.
+
+        Args:
+            nsid: Namespace identifier (1-based)
+            writes: List of (lba, data) pairs; each data must be a multiple
+                of the logical block size
+
+        Raises:
+            NVMeoFConnectionError: If not connected or connected to discovery subsystem
+            CommandError: If a write command fails (raised after the window's
+                remaining completions have been received)
+            ProtocolError: If the target sends an unexpected PDU
+            ValueError: If parameters are invalid
+
+        Reference: NVMe-oF TCP Transport Spec Rev 1.2, Section 3.3.2.2
+        """
+        if not self._connected:
+            raise NVMeoFConnectionError("Not connected to target")
+
+        if self._is_discovery_subsystem:
+            raise NVMeoFConnectionError("I/O operations not available on discovery subsystem")
+
+        logical_block_size = self._get_namespace_logical_block_size(nsid)
+
+        for lba, data in writes:
+            if not data:
+                raise ValueError("Data cannot be empty")
+            if len(data) % logical_block_size != 0:
+                raise ValueError(f"Data size ({len(data)}) must be multiple of logical block size "
+                                 f"({logical_block_size})")
+            if len(data) // logical_block_size > NVME_MAX_IO_SIZE:
+                raise ValueError(f"Data too large: {len(data) // logical_block_size} blocks, "
+                                 f"max {NVME_MAX_IO_SIZE}")
+            if lba < 0:
+                raise ValueError(f"Invalid LBA: {lba}, must be >= 0")
+
+        # Ensure I/O queues are set up before performing I/O operations
+        self.setup_io_queues()
+
+        inline_data_size = self._get_inline_data_size()
+        pipeline_depth = self._get_io_pipeline_depth()
+
+        # (start LBA, end LBA exclusive, data) of inline writes not yet submitted
+        window: list[tuple[int, int, bytes]] = []
+        for lba, data in writes:
+            if len(data) > inline_data_size:
+                if window:
+                    self._write_window(nsid, window, logical_block_size)
+                    window = []
+                self.write_data(nsid, lba, data)
+                continue
+
+            end_lba = lba + len(data) // logical_block_size
+            if len(window) == pipeline_depth or any(lba < w_end and w_lba < end_lba for w_lba, w_end, _ in window):
+                self._write_window(nsid, window, logical_block_size)
+                window = []
+            window.append((lba, end_lba, data))
+
+        if window:
+            self._write_window(nsid, window, logical_block_size)
+
+    def _write_window(self, nsid: int, window: list[tuple[int, int, bytes]], logical_block_size: int) -> None:
+        """
+        Submit a window of inline writes without waiting, then collect all their completions.
+
+        Args:
+            nsid: Namespace identifier (1-based)
+            window: (start LBA, end LBA exclusive, data) of each write
+            logical_block_size: Size of each logical block in bytes
+
+        Raises:
+            CommandError: If a write fails (raised after all completions have been received)
+            ProtocolError: If the target sends an unexpected PDU
+        """
+        pending = {}
+        for lba, _, data in window:
+            command_id = self._get_next_io_command_id()
+            self._send_nvme_write_pdu(command_id, nsid, lba, data, logical_block_size)
+            pending[command_id] = lba
+
+        self._logger.debug("Submitted %d pipelined writes on namespace %d", len(pending), nsid)
+
+        # Collect all completions (in any order) so the I/O socket stays in sync
+        # even if a write fails; report the first failure afterwards
+        first_error = None
+        while pending:
+            response_header, response_data = self._receive_pdu_on_socket(self._io_socket)
+            if response_header.pdu_type != PDUType.RSP:
+                raise ProtocolError(f"Expected RSP PDU for write response, got type {response_header.pdu_type}")
+
+            command_id = ResponseParser.parse_command_id(response_data)
+            if command_id not in pending:
+                raise ProtocolError(f"Unexpected write completion for command ID {command_id}")
+            del pending[command_id]
+
+            try:
+                ResponseParser.parse_response(response_data, command_id)
+            except CommandError as e:
+                if first_error is None:
+                    first_error = e
+
+        if first_error is not None:
+            self._logger.error("Pipelined write failed: %s", first_error)
+            raise first_error
+
+    @_io_queue_command
     def write_zeroes(self, nsid: int, lba: int, block_count: int) -> None:
         """
         Write zeros to specified logical block range without transferring data.
@@ -1723,6 +1881,7 @@ class NVMeoFClient:
             self._logger.error(f"Write Zeroes operation failed: {e}")
             raise
 
+    @_io_queue_command
     def compare_data(self, nsid: int, lba: int, data: bytes) -> None:
         """
         Compare data in specified logical blocks with provided data.
@@ -1797,6 +1956,7 @@ class NVMeoFClient:
             self._logger.error(f"Compare operation failed: {e}")
             raise
 
+    @_io_queue_command
     def write_uncorrectable(self, nsid: int, lba: int, block_count: int) -> None:
         """
         Mark specified logical blocks as containing uncorrectable data.
@@ -1861,6 +2021,7 @@ class NVMeoFClient:
             self._logger.error(f"Write Uncorrectable operation failed: {e}")
             raise
 
+    @_io_queue_command
     def flush_namespace(self, nsid: int) -> None:
         """
         Flush (sync) data to persistent storage for the specified namespace.
@@ -1910,6 +2071,7 @@ class NVMeoFClient:
             self._logger.error(f"Flush operation failed: {e}")
             raise
 
+    @_io_queue_command
     def reservation_register(self, nsid: int, action: int, reservation_key: int,
                              new_reservation_key: int = 0) -> ReservationInfo:
         """
@@ -1940,7 +2102,7 @@ class NVMeoFClient:
         # Parameter validation
         if nsid <= 0:
             raise ValueError("Namespace ID must be positive")
-        if action not in [ReservationAction.REGISTER, ReservationAction.UNREGISTER, ReservationAction.REPLACE]:
+        if not _in_bitmask(action, _VALID_REGISTER_ACTIONS):
             raise ValueError(f"Invalid reservation action: {action}")
         if action == ReservationAction.REPLACE and new_reservation_key == 0:
             raise ValueError("New reservation key required for Replace action")
@@ -1994,7 +2156,8 @@ class NVMeoFClient:
                     success=True,
                     reservation_key=reservation_key,
                     generation=0,  # Will be updated by subsequent report
-                    status_code=status_code
+                    status_code=status_code,
+                    controller_id=self._controller_id
                 )
             else:
                 raise ProtocolError(
@@ -2005,13 +2168,17 @@ class NVMeoFClient:
             self._logger.error(f"Reservation register operation failed: {e}")
             raise
 
-    def reservation_report(self, nsid: int, eds: int = 1) -> ReservationStatus:
+    @_io_queue_command
+    def reservation_report(self, nsid: int, eds: int = 1, key_filter: int | None = None) -> ReservationStatus:
         """
         Get the current reservation status for the namespace.
 
         Args:
             nsid: Namespace identifier (1-based)
             eds: Extended Data Structure bit (0=standard format, 1=extended format)
+            key_filter: If given, only registrants holding this reservation key are
+                listed. The command has no target-side filter, so the full report
+                is fetched and filtered here; reservation_holder is not filtered.
 
         Returns:
             ReservationStatus object with detailed reservation information
@@ -2129,14 +2296,17 @@ class NVMeoFClient:
                     reservation_key = registrant['reservation_key']
                     holds_reservation = registrant['holds_reservation']
 
+                    if holds_reservation:
+                        reservation_holder = controller_id
+
+                    if key_filter is not None and reservation_key != key_filter:
+                        continue
+
                     # All registrants in the parsed data are valid registered controllers
                     # The parser already filtered out unused slots based on controller ID
                     registered_controllers.append(controller_id)
                     reservation_keys[controller_id] = reservation_key
 
-                    if holds_reservation:
-                        reservation_holder = controller_id
-
                 self._logger.debug(
                     "Reservation report completed: gen=%d, type=%s, holder=%d, registered=%d",
                     generation, reservation_type, reservation_holder, len(registered_controllers))
@@ -2158,6 +2328,7 @@ class NVMeoFClient:
             self._logger.error(f"Reservation report operation failed: {e}")
             raise
 
+    @_io_queue_command
     def reservation_acquire(self, nsid: int, action: int, reservation_type: int,
                             reservation_key: int, preempt_key: int = 0) -> ReservationInfo:
         """
@@ -2189,9 +2360,9 @@ class NVMeoFClient:
         # Parameter validation
         if nsid <= 0:
             raise ValueError("Namespace ID must be positive")
-        if action not in [ReservationAction.ACQUIRE, ReservationAction.PREEMPT, ReservationAction.PREEMPT_AND_ABORT]:
+        if not _in_bitmask(action, _VALID_ACQUIRE_ACTIONS):
             raise ValueError(f"Invalid reservation acquire action: {action}")
-        if reservation_type not in [t.value for t in ReservationType]:
+        if not _in_bitmask(reservation_type, _VALID_RESERVATION_TYPES):
             raise ValueError(f"Invalid reservation type: {reservation_type}")
         if action in [ReservationAction.PREEMPT, ReservationAction.PREEMPT_AND_ABORT] and preempt_key == 0:
             raise ValueError("Preempt key required for Preempt actions")
@@ -2244,6 +2415,7 @@ class NVMeoFClient:
             self._logger.error(f"Reservation acquire operation failed: {e}")
             raise
 
+    @_io_queue_command
     def reservation_release(self, nsid: int, action: int, reservation_type: int,
                             reservation_key: int) -> ReservationInfo:
         """
@@ -2274,9 +2446,9 @@ class NVMeoFClient:
         # Parameter validation
         if nsid <= 0:
             raise ValueError("Namespace ID must be positive")
-        if action not in [ReservationAction.RELEASE, ReservationAction.CLEAR]:
+        if not _in_bitmask(action, _VALID_RELEASE_ACTIONS):
             raise ValueError(f"Invalid reservation release action: {action}")
-        if reservation_type not in [t.value for t in ReservationType]:
+        if not _in_bitmask(reservation_type, _VALID_RESERVATION_TYPES):
             raise ValueError(f"Invalid reservation type: {reservation_type}")
 
         # Ensure I/O queues are set up
@@ -2964,13 +3136,39 @@ class NVMeoFClient:
 
     def _recv_exactly(self, sock: socket.socket, size: int) -> bytes:
         """Receive exactly the specified number of bytes from socket."""
-        data = b''
-        while len(data) < size:
-            chunk = sock.recv(size - len(data))
+        data = sock.recv(size)
+        if not data:
+            raise NVMeoFConnectionError("Connection closed by target")
+        if len(data) == size:
+            # Common case: the whole PDU section arrived in one read
+            return data
+
+        # Short read: accumulate in place instead of re-copying a growing bytes object
+        buffer = bytearray(data)
+        while len(buffer) < size:
+            chunk = sock.recv(size - len(buffer))
             if not chunk:
                 raise NVMeoFConnectionError("Connection closed by target")
-            data += chunk
-        return data
+            buffer += chunk
+        return bytes(buffer)
+
+    def _get_io_pipeline_depth(self) -> int:
+        """
+        Get the maximum number of commands to keep outstanding on the I/O queue.
+
+        A submission queue is full with one entry free, so at most entries - 1
+        commands fit; the controller's MAXCMD limit applies as well if reported.
+
+        Returns:
+            Number of commands that may be outstanding at once (at least 1)
+
+        Reference: NVM Express Base Specification Section 3.3.1 (full queue condition);
+        Section 5.2.13.2.1, Figure 328 (MAXCMD)
+        """
+        depth = self._io_queue_size - 1
+        if self._maxcmd:
+            depth = min(depth, self._maxcmd)
+        return max(depth, 1)
 
     def _get_inline_data_size(self) -> int:
         """
@@ -3567,6 +3765,16 @@ class NVMeoFClient:
             nsid: Namespace identifier
             data: Optional command data
         """
+        if data:
+            # In-capsule data, built like the write path: SGL Data Block with Offset
+            # descriptor in SGL Entry 1, data immediately after the 72-byte command header
+            # Reference: NVMe-oF TCP Transport Specification Table 7 "Command PDU"
+            data_cmd = pack_nvme_data_command(opcode, command_id, nsid, len(data))
+            header = pack_pdu_header(PDUType.CMD, 0, NVMEOF_TCP_CMD_HEADER_LEN, NVMEOF_TCP_CMD_PDO,
+                                     NVMEOF_TCP_CMD_HEADER_LEN + len(data))
+            self._socket.sendall(header + data_cmd + data)
+            return
+
         # Build NVMe command
         nvme_cmd = pack_nvme_command(opcode, 0, command_id, nsid)
 
@@ -3579,33 +3787,6 @@ class NVMeoFClient:
         header = pack_pdu_header(PDUType.CMD, 0, header_len, header_len, total_len)
         self._socket.sendall(header + nvme_cmd)
 
-        # Send data PDU if present
-        if data:
-            self._send_pdu(PDUType.DATA, data)
-
-    def _send_pdu(self, pdu_type: int, data: bytes) -> None:
-        """
-        Send PDU with header and data.
-
-        Args:
-            pdu_type: PDU type identifier
-            data: PDU payload data
-        """
-        if not self._socket:
-            raise NVMeoFConnectionError("Socket not available")
-
-        # Build PDU header
-        header_len = 8
-        data_len = len(data)
-        total_len = header_len + data_len
-
-        # PDU data offset should be 0 for PDUs without separate data section
-        pdo = header_len if data else 0
-        header = pack_pdu_header(pdu_type, 0, header_len, pdo, total_len)
-
-        # Send header and data
-        self._socket.sendall(header + data)
-
     def _receive_pdu(self) -> tuple[PDUHeader, bytes]:
         """
         Receive PDU header and data.
@@ -3667,8 +3848,11 @@ class NVMeoFClient:
         Returns:
             Parsed response dictionary
         """
-        if timeout:
-            original_timeout = self._socket.gettimeout()
+        # The socket already runs at self.timeout since connect(); only reconfigure it
+        # (and restore it afterwards) when this command asks for something different
+        original_timeout = self._socket.gettimeout()
+        override_timeout = bool(timeout) and timeout != original_timeout
+        if override_timeout:
             self._socket.settimeout(timeout)
 
         try:
@@ -3682,7 +3866,7 @@ class NVMeoFClient:
         except socket.timeout:
             raise NVMeoFTimeoutError(f"Response timeout after {timeout} seconds")
         finally:
-            if timeout:
+            if override_timeout:
                 self._socket.settimeout(original_timeout)
 
     def _get_namespace_logical_block_size(self, nsid: int) -> int:
@@ -3757,7 +3941,7 @@ class NVMeoFClient:
 
         # Send PDU header + NVMe command (total 72 bytes) on I/O connection
         pdu_data = pdu_header + nvme_command
-        self._io_socket.send(pdu_data)
+        self._io_socket.sendall(pdu_data)
 
         self._logger.debug(f"I/O command PDU sent ({len(pdu_data)} bytes)")
 
@@ -3872,7 +4056,7 @@ class NVMeoFClient:
 
         # Send PDU: header + NVMe command + data
         pdu_data = pdu_header + nvme_command + data
-        self._io_socket.send(pdu_data)
+        self._io_socket.sendall(pdu_data)
 
         self._logger.debug(f"Reservation command PDU sent ({len(pdu_data)} bytes total)")
 
@@ -3920,7 +4104,7 @@ class NVMeoFClient:
 
         # Send PDU: header + NVMe command + data
         pdu_data = pdu_header + nvme_command + data
-        self._socket.send(pdu_data)
+        self._socket.sendall(pdu_data)
 
         self._logger.debug(f"Compare command PDU sent ({len(pdu_data)} bytes total)")
 
@@ -3937,17 +4121,7 @@ class NVMeoFClient:
         if not self._socket:
             raise NVMeoFConnectionError("Socket not available")
 
-        data = b''
-        while len(data) < length:
-            chunk = self._socket.recv(length - len(data))
-            self._logger.debug(
-                "Received chunk: %s (length=%d)",
-                chunk.hex() if chunk else 'None', len(chunk) if chunk else 0)
-            if not chunk:
-                raise NVMeoFConnectionError("Connection closed by target")
-            data += chunk
-
-        return data
+        return self._recv_exactly(self._socket, length)
 
     def _send_termination_pdu(self) -> None:
         """
@@ -4012,7 +4186,7 @@ class NVMeoFClient:
         Reference: NVM Express Base Specification Rev 2.1, Section 4.1
         """
         cmd_id = self._admin_command_id_counter
-        self._admin_command_id_counter = (self._admin_command_id_counter + 1) & NVME_COMMAND_ID_MASK
+        self._admin_command_id_counter = (cmd_id + 1) & NVME_COMMAND_ID_MASK
         return cmd_id
 
     def _get_next_io_command_id(self) -> int:
@@ -4023,7 +4197,7 @@ class NVMeoFClient:
         Reference: NVM Express Base Specification Rev 2.1, Section 4.1
         """
         cmd_id = self._io_command_id_counter
-        self._io_command_id_counter = (self._io_command_id_counter + 1) & NVME_COMMAND_ID_MASK
+        self._io_command_id_counter = (cmd_id + 1) & NVME_COMMAND_ID_MASK
         return cmd_id
 
     def _get_next_command_id(self) -> int:
@@ -4043,6 +4217,8 @@ class NVMeoFClient:
             except Exception:
                 pass
             self._socket = None
+        # is_connected reports this flag alone, so it must never outlive the admin socket
+        self._connected = False
 
     def _cleanup_io_socket(self) -> None:
         """Clean up I/O socket resources."""
@@ -14,7 +14,7 @@ from .protocol.status_codes import decode_status_code
 
 class NVMeoFError(Exception):
     """Base exception class for all NVMe-oF client errors."""
-    pass
+    __slots__ = ()
 
 
 class NVMeoFConnectionError(NVMeoFError):
@@ -63,6 +63,10 @@ class CommandError(NVMeoFError):
 
     Reference: NVM Express Base Specification Rev 2.1, Section 1.6 "Status Codes"
     """
+    # Slots keep the four attributes out of a per-instance __dict__; one is still
+    # created lazily if callers attach extra attributes (BaseException has one).
+    __slots__ = ('status_code', 'command_id', 'status_description', 'spec_reference')
+
     def __init__(self, message, status_code=None, command_id=None):
         super().__init__(message)
         self.status_code = status_code
@@ -76,6 +80,10 @@ class CommandError(NVMeoFError):
             self.status_description = description
             self.spec_reference = spec_ref
 
+    def __reduce__(self):
+        # BaseException pickles only args and __dict__, which no longer holds the attributes
+        return (type(self), (*self.args[:1], self.status_code, self.command_id))
+
 
 class ProtocolError(NVMeoFError):
     """
@@ -10,7 +10,8 @@ References:
 - NVM Command Set Specification 1.0c
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 from enum import IntEnum
 
@@ -319,7 +320,7 @@ class ControllerStatus:
         return self.ready and not self.controller_fatal_status
 
 
-@dataclass
+@dataclass(slots=True)
 class ReservationStatus:
     """
     NVMe Reservation Status Information from Reservation Report command.
@@ -346,7 +347,7 @@ class ReservationStatus:
         return len(self.registered_controllers)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReservationInfo:
     """
     Reservation operation result information.
@@ -361,6 +362,7 @@ class ReservationInfo:
 
     # Optional detailed status
     reservation_status: ReservationStatus | None = None  # Full reservation status if requested
+    controller_id: int | None = None   # Controller ID of this host, as it appears in reservation reports
 
 
 class AsyncEventType(IntEnum):
@@ -411,7 +413,7 @@ class AsyncEventInfoImmediate(IntEnum):
     TEMPERATURE_THRESHOLD_HYSTERESIS = 0x01   # Temperature Threshold Hysteresis Recovery (TTHR)
 
 
-@dataclass
+@dataclass(slots=True)
 class AsyncEvent:
     """
     Asynchronous Event notification from controller.
@@ -423,7 +425,7 @@ class AsyncEvent:
     Reference: NVM Express Base Specification 2.3, Figures 150-151
     """
 
-    event_type: AsyncEventType              # Bits 2:0 of Dword 0 - Event type category
+    event_type: AsyncEventType | int        # Bits 2:0 of Dword 0 - Event type category (raw int if reserved)
     event_info: int                         # Bits 15:08 of Dword 0 - Specific event within category
     log_page_id: int                        # Bits 23:16 of Dword 0 - Associated log page (0-255)
 
@@ -457,7 +459,7 @@ class AsyncEvent:
         return self.event_type == AsyncEventType.IMMEDIATE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ANAGroupDescriptor:
     """
     ANA Group Descriptor containing state and namespace information for an ANA Group.
@@ -474,15 +476,13 @@ class ANAGroupDescriptor:
     ana_state: ANAState         # ANAS: byte 16 bits 03:00, Current ANA state for this group
     namespace_ids: list[int]    # Bytes 35:32+, List of NSIDs in this ANA Group (ascending order)
 
-    @property
-    def is_accessible(self) -> bool:
-        """Check if namespaces in this group are accessible (Optimized or Non-Optimized state)."""
-        return self.ana_state in (ANAState.OPTIMIZED, ANAState.NON_OPTIMIZED)
+    # Derived from ana_state at construction (a descriptor is a frozen point-in-time snapshot)
+    is_accessible: bool = field(init=False, repr=False, compare=False)  # Optimized or Non-Optimized state
+    is_optimized: bool = field(init=False, repr=False, compare=False)   # Preferred/optimized path
 
-    @property
-    def is_optimized(self) -> bool:
-        """Check if this is the preferred/optimized path for these namespaces."""
-        return self.ana_state == ANAState.OPTIMIZED
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'is_accessible', self.ana_state in (ANAState.OPTIMIZED, ANAState.NON_OPTIMIZED))
+        object.__setattr__(self, 'is_optimized', self.ana_state == ANAState.OPTIMIZED)
 
 
 @dataclass
@@ -500,29 +500,48 @@ class ANALogPage:
     num_ana_group_descriptors: int         # Bytes 15:08, Number of ANA Group Descriptors in this log
     groups: list[ANAGroupDescriptor]       # List of ANA Group Descriptors (one per ANA Group)
 
-    def get_group(self, ana_group_id: int) -> ANAGroupDescriptor | None:
-        """Get descriptor for a specific ANA Group ID, or None if not found."""
+    # Lookup indexes are built from groups on first use (the log page is a point-in-time
+    # snapshot); the first descriptor listing an ID wins, matching a linear scan of groups
+
+    @cached_property
+    def _group_index(self) -> dict[int, ANAGroupDescriptor]:
+        """ANA Group ID -> descriptor."""
+        group_index: dict[int, ANAGroupDescriptor] = {}
         for group in self.groups:
-            if group.ana_group_id == ana_group_id:
-                return group
-        return None
+            group_index.setdefault(group.ana_group_id, group)
+        return group_index
 
-    def get_namespace_state(self, nsid: int) -> ANAState | None:
-        """Get the ANA state for a specific namespace ID, or None if not found."""
+    @cached_property
+    def _nsid_index(self) -> dict[int, ANAGroupDescriptor]:
+        """NSID -> descriptor of the owning group."""
+        nsid_index: dict[int, ANAGroupDescriptor] = {}
         for group in self.groups:
-            if nsid in group.namespace_ids:
-                return group.ana_state
-        return None
+            for nsid in group.namespace_ids:
+                nsid_index.setdefault(nsid, group)
+        return nsid_index
 
-    @property
-    def optimized_groups(self) -> list[ANAGroupDescriptor]:
-        """Get list of ANA Groups in Optimized state."""
-        return [g for g in self.groups if g.ana_state == ANAState.OPTIMIZED]
+    def get_group(self, ana_group_id: int) -> ANAGroupDescriptor | None:
+        """Get descriptor for a specific ANA Group ID, or None if not found."""
+        return self._group_index.get(ana_group_id)
 
-    @property
-    def accessible_groups(self) -> list[ANAGroupDescriptor]:
-        """Get list of ANA Groups in accessible states (Optimized or Non-Optimized)."""
-        return [g for g in self.groups if g.is_accessible]
+    def get_group_for_namespace(self, nsid: int) -> ANAGroupDescriptor | None:
+        """Get the descriptor of the ANA Group containing a namespace ID, or None if not found."""
+        return self._nsid_index.get(nsid)
+
+    def get_namespace_state(self, nsid: int) -> ANAState | None:
+        """Get the ANA state for a specific namespace ID, or None if not found."""
+        group = self._nsid_index.get(nsid)
+        return group.ana_state if group is not None else None
+
+    @cached_property
+    def optimized_groups(self) -> tuple[ANAGroupDescriptor, ...]:
+        """Get ANA Groups in Optimized state (computed once per log page)."""
+        return tuple(g for g in self.groups if g.is_optimized)
+
+    @cached_property
+    def accessible_groups(self) -> tuple[ANAGroupDescriptor, ...]:
+        """Get ANA Groups in accessible states (Optimized or Non-Optimized, computed once per log page)."""
+        return tuple(g for g in self.groups if g.is_accessible)
 
 
 # Type aliases for backward compatibility with legacy dictionary-based APIs
@@ -5,6 +5,8 @@ This module handles parsing of the ANA log page data structures
 as defined in the NVMe Base Specification.
 """
 
+import struct
+
 from .base import BaseParser
 from ..models import (
     ANAGroupDescriptor,
@@ -12,6 +14,18 @@ from ..models import (
     ANAState,
 )
 
+# Header: CHGC (8 bytes), NAGD (2 bytes), reserved (6 bytes)
+_ANA_HEADER = struct.Struct('<QH6x')
+
+# Group descriptor fixed fields: AGID (4), NNV (4), CHGC (8), ANAS (1), reserved (15)
+_ANA_GROUP_DESCRIPTOR = struct.Struct('<LLQB15x')
+
+# ANA state for every 4-bit ANAS value; reserved values map to CHANGE
+_ANA_STATE_TABLE = tuple(
+    next((state for state in ANAState if state == value), ANAState.CHANGE)
+    for value in range(16)
+)
+
 
 class ANALogPageParser(BaseParser):
     """Parser for NVMe ANA Log Page data structures."""
@@ -35,8 +49,8 @@ class ANALogPageParser(BaseParser):
         # Parse header (16 bytes)
         change_count, num_descriptors = cls._parse_header(data[:16])
 
-        # Parse ANA Group Descriptors starting at byte 16
-        groups = cls._parse_ana_group_descriptors(data[16:], num_descriptors)
+        # Parse ANA Group Descriptors starting at byte 16 (memoryview avoids copying the rest of the page)
+        groups = cls._parse_ana_group_descriptors(memoryview(data)[16:], num_descriptors)
 
         return ANALogPage(
             change_count=change_count,
@@ -62,16 +76,10 @@ class ANALogPageParser(BaseParser):
         """
         cls.validate_data_length(data, 16, "ANA log page header")
 
-        # Bytes 0-7: Change Count (CHGC) - 64-bit LE
-        change_count = cls.safe_unpack('<Q', data, 0)[0]
-
-        # Bytes 8-9: Number of ANA Group Descriptors (NAGD) - 16-bit LE
-        num_descriptors = cls.safe_unpack('<H', data, 8)[0]
-
-        return change_count, num_descriptors
+        return _ANA_HEADER.unpack_from(data, 0)
 
     @classmethod
-    def _parse_ana_group_descriptors(cls, data: bytes, num_descriptors: int) -> list[ANAGroupDescriptor]:
+    def _parse_ana_group_descriptors(cls, data: bytes | memoryview, num_descriptors: int) -> list[ANAGroupDescriptor]:
         """
         Parse list of ANA Group Descriptors.
 
@@ -89,28 +97,33 @@ class ANALogPageParser(BaseParser):
         Returns:
             List of ANAGroupDescriptor dataclasses
         """
-        groups = []
+        groups: list[ANAGroupDescriptor] = []
         offset = 0
 
+        # Bound once outside the loop, which runs once per ANA Group
+        data_length = len(data)
+        parse_descriptor = cls._parse_single_ana_group_descriptor
+        append_group = groups.append
+
         for i in range(num_descriptors):
-            if offset >= len(data):
+            if offset >= data_length:
                 break
 
             # Need at least 32 bytes for descriptor header
-            if offset + 32 > len(data):
+            if offset + 32 > data_length:
                 raise ValueError(
                     f"Insufficient data for ANA Group Descriptor {i}: "
-                    f"need at least {offset + 32} bytes, got {len(data)}"
+                    f"need at least {offset + 32} bytes, got {data_length}"
                 )
 
-            group, descriptor_size = cls._parse_single_ana_group_descriptor(data[offset:])
-            groups.append(group)
+            group, descriptor_size = parse_descriptor(data, offset)
+            append_group(group)
             offset += descriptor_size
 
         return groups
 
     @classmethod
-    def _parse_single_ana_group_descriptor(cls, data: bytes) -> tuple:
+    def _parse_single_ana_group_descriptor(cls, data: bytes | memoryview, offset: int = 0) -> tuple:
         """
         Parse a single ANA Group Descriptor.
 
@@ -127,31 +140,20 @@ class ANALogPageParser(BaseParser):
 
         Args:
             data: Raw descriptor data
+            offset: Offset of the descriptor within data
 
         Returns:
             Tuple of (ANAGroupDescriptor, descriptor_size_in_bytes)
         """
-        cls.validate_data_length(data, 32, "ANA Group Descriptor header")
-
-        # Bytes 0-3: ANA Group ID (32-bit LE)
-        ana_group_id = cls.safe_unpack('<L', data, 0)[0]
+        cls.validate_data_length(data, offset + 32, "ANA Group Descriptor header")
 
-        # Bytes 4-7: Number of NSID Values (32-bit LE)
-        num_namespaces = cls.safe_unpack('<L', data, 4)[0]
+        ana_group_id, num_namespaces, change_count, ana_state_byte = _ANA_GROUP_DESCRIPTOR.unpack_from(data, offset)
 
-        # Bytes 8-15: Change Count (64-bit LE)
-        change_count = cls.safe_unpack('<Q', data, 8)[0]
-
-        # Byte 16 bits 0-3: ANA State
-        ana_state_value = data[16] & 0x0F
-        try:
-            ana_state = ANAState(ana_state_value)
-        except ValueError:
-            # If we get an unknown state value, default to CHANGE
-            ana_state = ANAState.CHANGE
+        # Byte 16 bits 0-3: ANA State (unknown state values map to CHANGE)
+        ana_state = _ANA_STATE_TABLE[ana_state_byte & 0x0F]
 
         # Parse namespace ID list starting at byte 32
-        namespace_ids = cls._parse_namespace_id_list(data[32:], num_namespaces)
+        namespace_ids = cls._parse_namespace_id_list(data, num_namespaces, offset + 32)
 
         # Calculate total descriptor size: 32 byte header + 4 bytes per NSID
         descriptor_size = 32 + (4 * num_namespaces)
@@ -167,31 +169,27 @@ class ANALogPageParser(BaseParser):
         return descriptor, descriptor_size
 
     @classmethod
-    def _parse_namespace_id_list(cls, data: bytes, num_namespaces: int) -> list[int]:
+    def _parse_namespace_id_list(cls, data: bytes | memoryview, num_namespaces: int, offset: int = 0) -> list[int]:
         """
         Parse list of namespace IDs from ANA Group Descriptor.
 
-        Each NSID is 4 bytes (32-bit LE).
+        Each NSID is 4 bytes (32-bit LE); the whole list is decoded with one unpack call.
 
         Args:
-            data: Raw NSID list data
+            data: Raw data containing the NSID list
             num_namespaces: Number of NSIDs to parse
+            offset: Offset of the NSID list within data
 
         Returns:
             List of namespace IDs
         """
-        namespace_ids = []
         required_size = num_namespaces * 4
+        available = len(data) - offset
 
-        if len(data) < required_size:
+        if available < required_size:
             raise ValueError(
                 f"Insufficient data for namespace ID list: "
-                f"need {required_size} bytes for {num_namespaces} NSIDs, got {len(data)}"
+                f"need {required_size} bytes for {num_namespaces} NSIDs, got {available}"
             )
 
-        for i in range(num_namespaces):
-            offset = i * 4
-            nsid = cls.safe_unpack('<L', data, offset)[0]
-            namespace_ids.append(nsid)
-
-        return namespace_ids
+        return list(struct.unpack_from(f'<{num_namespaces}L', data, offset))
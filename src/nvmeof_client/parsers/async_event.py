@@ -4,7 +4,8 @@ NVMe Asynchronous Event parsing.
 This module handles parsing of NVMe Asynchronous Event Request completions.
 """
 
-from typing import Any
+import functools
+from typing import Any, NamedTuple
 from .base import BaseParser
 from ..models import (
     AsyncEvent,
@@ -13,6 +14,36 @@ from ..models import (
     AsyncEventInfoImmediate
 )
 
+# SMART / Health Status event information codes (Figure 153)
+_SMART_HEALTH_EVENTS = {
+    0x00: "NVM Subsystem Reliability",
+    0x01: "Temperature Threshold",
+    0x02: "Spare Capacity Below Threshold"
+}
+
+# Event type for each 3-bit AET value; reserved values are kept as raw integers
+_EVENT_TYPES = tuple(next((t for t in AsyncEventType if t == value), value) for value in range(8))
+
+# Descriptions of the (event type, event information) pairs defined by the specification,
+# built once so parsing a known event is a single lookup
+_EVENT_DESCRIPTIONS: dict[tuple[AsyncEventType | int, int], str] = {
+    **{(AsyncEventType.SMART_HEALTH_STATUS, info): f"SMART/Health Status: {name}"
+       for info, name in _SMART_HEALTH_EVENTS.items()},
+    **{(AsyncEventType.NOTICE, notice): f"Notice: {notice.name}" for notice in AsyncEventInfoNotice},
+    **{(AsyncEventType.IMMEDIATE, immediate): f"Immediate Event: {immediate.name}"
+       for immediate in AsyncEventInfoImmediate},
+}
+
+
+class _DecodedEvent(NamedTuple):
+    """Fields decoded from an Asynchronous Event Request completion."""
+
+    event_type: AsyncEventType | int
+    event_info: int
+    log_page_id: int
+    event_specific_param: int | None
+    description: str
+
 
 class AsyncEventParser(BaseParser):
     """Parser for NVMe Asynchronous Event completions."""
@@ -33,59 +64,69 @@ class AsyncEventParser(BaseParser):
                    Figure 150: Asynchronous Event Request – Completion Queue Entry Dword 0
                    Figure 151: Asynchronous Event Request – Completion Queue Entry Dword 1
         """
+        parsed = cls._decode_completion(dw0, dw1)._asdict()
+        parsed['raw_dword0'] = dw0
+        return parsed
+
+    @classmethod
+    def parse_async_event_to_object(cls, dw0: int, dw1: int) -> AsyncEvent:
+        """
+        Parse Asynchronous Event Request completion to AsyncEvent object.
+
+        Args:
+            dw0: Completion queue entry Dword 0
+            dw1: Completion queue entry Dword 1
+
+        Returns:
+            AsyncEvent dataclass instance
+        """
+        decoded = cls._decode_completion(dw0, dw1)
+        return AsyncEvent(
+            event_type=decoded.event_type,
+            event_info=decoded.event_info,
+            log_page_id=decoded.log_page_id,
+            description=decoded.description,
+            raw_dword0=dw0,
+            event_specific_param=decoded.event_specific_param
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _decode_completion(cls, dw0: int, dw1: int) -> _DecodedEvent:
+        """
+        Decode the Asynchronous Event Request completion dwords.
+
+        Shared by the dictionary and AsyncEvent parsers, so neither builds the other's result.
+        The result is immutable, so repeated completions (e.g. a run of ANA change notices)
+        are served from the cache.
+        """
         # Parse Dword 0 fields
         # Bits 2:0 = Asynchronous Event Type (AET)
         # Bits 7:3 = Reserved
         # Bits 15:8 = Asynchronous Event Information (AEI)
         # Bits 23:16 = Log Page Identifier (LID)
         # Bits 31:24 = Reserved
-        event_type_raw = dw0 & 0x7  # Bits 2:0
+        event_type = _EVENT_TYPES[dw0 & 0x7]  # Bits 2:0, raw value kept if unknown
         event_info = (dw0 >> 8) & 0xFF  # Bits 15:8
         log_page_id = (dw0 >> 16) & 0xFF  # Bits 23:16
 
-        # Convert to enum
-        try:
-            event_type = AsyncEventType(event_type_raw)
-        except ValueError:
-            event_type = event_type_raw  # Keep raw value if unknown
-
         # Event Specific Parameter from Dword 1
         event_specific_param = dw1 if dw1 != 0 else None
 
         # Generate human-readable description
-        description = cls._describe_event(event_type, event_info, log_page_id)
-
-        return {
-            'event_type': event_type,
-            'event_info': event_info,
-            'log_page_id': log_page_id,
-            'event_specific_param': event_specific_param,
-            'description': description,
-            'raw_dword0': dw0
-        }
+        description = _EVENT_DESCRIPTIONS.get((event_type, event_info))
+        if description is None:
+            description = cls._describe_event(event_type, event_info, log_page_id)
 
-    @classmethod
-    def parse_async_event_to_object(cls, dw0: int, dw1: int) -> AsyncEvent:
-        """
-        Parse Asynchronous Event Request completion to AsyncEvent object.
-
-        Args:
-            dw0: Completion queue entry Dword 0
-            dw1: Completion queue entry Dword 1
-
-        Returns:
-            AsyncEvent dataclass instance
-        """
-        parsed = cls.parse_async_event_completion(dw0, dw1)
-        return AsyncEvent(**parsed)
+        return _DecodedEvent(event_type, event_info, log_page_id, event_specific_param, description)
 
     @staticmethod
-    def _describe_event(event_type: AsyncEventType, event_info: int, log_page_id: int) -> str:
+    def _describe_event(event_type: AsyncEventType | int, event_info: int, log_page_id: int) -> str:
         """
         Generate human-readable description of async event.
 
         Args:
-            event_type: Event type enum value
+            event_type: Event type enum value, or raw int for reserved types
             event_info: Event information code
             log_page_id: Associated log page identifier
 
@@ -98,12 +139,7 @@ class AsyncEventParser(BaseParser):
             return f"Error Status Event (info={event_info:#x}, log_page={log_page_id:#x})"
 
         elif event_type == AsyncEventType.SMART_HEALTH_STATUS:
-            smart_events = {
-                0x00: "NVM Subsystem Reliability",
-                0x01: "Temperature Threshold",
-                0x02: "Spare Capacity Below Threshold"
-            }
-            desc = smart_events.get(event_info, f"Unknown SMART Event {event_info:#x}")
+            desc = _SMART_HEALTH_EVENTS.get(event_info, f"Unknown SMART Event {event_info:#x}")
             return f"SMART/Health Status: {desc}"
 
         elif event_type == AsyncEventType.NOTICE:
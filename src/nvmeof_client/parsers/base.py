@@ -63,7 +63,7 @@ class BaseParser:
         return data.hex() if data else ""
 
     @staticmethod
-    def validate_data_length(data: bytes, expected_min_length: int, name: str = "data") -> None:
+    def validate_data_length(data: bytes | memoryview, expected_min_length: int, name: str = "data") -> None:
         """
         Validate that data meets minimum length requirements.
 
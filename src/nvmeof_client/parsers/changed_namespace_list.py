@@ -7,14 +7,29 @@ Reference: NVM Express Base Specification 2.3
 """
 
 import struct
+from typing import (
+    Literal,
+    overload,
+)
 from .base import BaseParser
 
+# Little-endian encoding of the zero NSID that terminates the list
+_ZERO_NSID = bytes(4)
+
 
 class ChangedNamespaceListParser(BaseParser):
     """Parser for Changed Attached Namespace List log page."""
 
+    @overload
+    @classmethod
+    def parse_changed_namespace_list(cls, data: bytes, *, as_tuple: Literal[False] = ...) -> list[int]: ...
+
+    @overload
+    @classmethod
+    def parse_changed_namespace_list(cls, data: bytes, *, as_tuple: Literal[True]) -> tuple[int, ...]: ...
+
     @classmethod
-    def parse_changed_namespace_list(cls, data: bytes) -> list[int]:
+    def parse_changed_namespace_list(cls, data: bytes, *, as_tuple: bool = False) -> list[int] | tuple[int, ...]:
         """
         Parse Changed Attached Namespace List log page.
 
@@ -33,10 +48,12 @@ class ChangedNamespaceListParser(BaseParser):
 
         Args:
             data: Raw log page data (up to 4096 bytes)
+            as_tuple: Return the decoded tuple as is instead of copying it into a list,
+                      for callers that only read the result
 
         Returns:
             List of namespace IDs that have changed (in ascending order), or
-            [0xFFFFFFFF] if more than 1,024 namespaces changed
+            [0xFFFFFFFF] if more than 1,024 namespaces changed. A tuple when as_tuple is set.
 
         Reference:
             NVM Express Base Specification 2.3
@@ -44,7 +61,7 @@ class ChangedNamespaceListParser(BaseParser):
             Figure 139 "Namespace List Format"
         """
         if not data:
-            return []
+            return () if as_tuple else []
 
         # Validate data length (should be multiple of 4 bytes, up to 4096)
         if len(data) % 4 != 0:
@@ -52,36 +69,32 @@ class ChangedNamespaceListParser(BaseParser):
             padding = 4 - (len(data) % 4)
             data = data + b'\x00' * padding
 
-        changed_namespaces = []
-
-        # Parse up to 1,024 entries (4096 bytes / 4 bytes per NSID)
-        max_entries = min(len(data) // 4, 1024)
-
-        for i in range(max_entries):
-            offset = i * 4
-            nsid = struct.unpack('<L', data[offset:offset + 4])[0]
-
-            # Zero NSID indicates end of list (unused entry)
-            if nsid == 0:
-                break
+        # Up to 1,024 entries (4096 bytes / 4 bytes per NSID)
+        list_length = min(len(data), 4096)
 
-            # Check for overflow indicator (first entry = FFFFFFFFh)
-            if i == 0 and nsid == 0xFFFFFFFF:
-                # More than 1,024 namespaces changed
-                return [0xFFFFFFFF]
+        # Check for overflow indicator (first entry = FFFFFFFFh)
+        if data[:4] == b'\xff\xff\xff\xff':
+            # More than 1,024 namespaces changed
+            return (0xFFFFFFFF,) if as_tuple else [0xFFFFFFFF]
 
-            # Add to list (entries are in ascending order per spec)
-            changed_namespaces.append(nsid)
+        # Zero NSID indicates end of list (unused entry); entries are in ascending order per spec.
+        # Locate it with a C-level byte search, skipping zero runs that straddle two entries.
+        end = data.find(_ZERO_NSID, 0, list_length)
+        while end != -1 and end & 3:
+            end = data.find(_ZERO_NSID, (end | 3) + 1, list_length)
+        if end == -1:
+            end = list_length
 
-        return changed_namespaces
+        nsids = struct.unpack_from(f'<{end // 4}L', data)
+        return nsids if as_tuple else list(nsids)
 
     @classmethod
-    def format_changed_namespace_list(cls, nsids: list[int]) -> str:
+    def format_changed_namespace_list(cls, nsids: list[int] | tuple[int, ...]) -> str:
         """
         Format changed namespace list for human-readable display.
 
         Args:
-            nsids: List of namespace IDs
+            nsids: List or tuple of namespace IDs
 
         Returns:
             Formatted string describing the changed namespaces
@@ -90,14 +103,14 @@ class ChangedNamespaceListParser(BaseParser):
             return "No namespace changes detected"
 
         # Check for overflow indicator
-        if nsids == [0xFFFFFFFF]:
+        if len(nsids) == 1 and nsids[0] == 0xFFFFFFFF:
             return "More than 1,024 namespaces changed (overflow)"
 
         if len(nsids) == 1:
             return f"1 namespace changed: NSID {nsids[0]}"
 
         # For multiple namespaces, show list
-        nsid_str = ", ".join(str(nsid) for nsid in nsids[:10])
+        nsid_str = ", ".join(map(str, nsids[:10]))
         if len(nsids) > 10:
             nsid_str += f", ... ({len(nsids) - 10} more)"
 
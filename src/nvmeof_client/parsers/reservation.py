@@ -5,9 +5,19 @@ This module handles parsing of NVMe Reservation Report data structures
 as defined in the NVMe Base Specification.
 """
 
+import struct
 from typing import Any
 from .base import BaseParser
 
+# Reservation status header fields: GEN, RTYPE, REGSTRNT, reserved, PTPLS (bytes 0-9)
+_RESERVATION_STATUS_HEADER = struct.Struct('<LBH2xB')
+
+# Figure 583: CNTLID, RCSTS, reserved, HOSTID (64-bit), RKEY
+_STANDARD_REGISTRANT = struct.Struct('<HB5xQQ')
+
+# Figure 584: CNTLID, RCSTS, reserved, RKEY, HOSTID (128-bit as low/high halves), reserved
+_EXTENDED_REGISTRANT = struct.Struct('<HB5xQQQ32x')
+
 
 class ReservationDataParser(BaseParser):
     """Parser for NVMe Reservation Report data structures."""
@@ -65,16 +75,12 @@ class ReservationDataParser(BaseParser):
         cls.validate_data_length(data, 24, "Reservation status header")
 
         # Bytes 0-3: Generation counter (GEN) (32-bit LE)
-        generation = cls.safe_unpack('<L', data, 0)[0]
-
         # Byte 4: Reservation Type (RTYPE)
-        reservation_type = data[4]
-
         # Bytes 5-6: Number of Registrants (REGSTRNT) (16-bit LE)
-        num_registered_controllers = cls.safe_unpack('<H', data, 5)[0]
-
         # Byte 9: Persist Through Power Loss State (PTPLS)
-        persist_through_power_loss = bool(data[9] & 0x1)
+        generation, reservation_type, num_registered_controllers, ptpls = \
+            _RESERVATION_STATUS_HEADER.unpack_from(data)
+        persist_through_power_loss = bool(ptpls & 0x1)
 
         return {
             'generation': generation,
@@ -98,38 +104,18 @@ class ReservationDataParser(BaseParser):
         Note: Only include registrants with valid controller IDs.
         """
         registrants = []
-        entry_size = 24
-
-        # If num_registrants is specified, only parse that many entries
-        max_entries = num_registrants if num_registrants is not None else len(data) // entry_size
-
-        for i in range(max_entries):
-            offset = i * entry_size
-            if offset + entry_size > len(data):
-                break
-
-            entry = data[offset:offset + entry_size]
-
-            # Bytes 0-1: Controller ID
-            controller_id = cls.safe_unpack('<H', entry, 0)[0]
+        num_entries = cls._count_registrants(data, num_registrants, _STANDARD_REGISTRANT.size)
 
+        # Decode all complete entries in one pass over the buffer
+        entries = memoryview(data)[:num_entries * _STANDARD_REGISTRANT.size]
+        for controller_id, rcsts, host_identifier, reservation_key in _STANDARD_REGISTRANT.iter_unpack(entries):
             # Only process entries with valid controller IDs
             if controller_id == 0:
                 continue
 
-            # Bytes 16-23: Reservation Key (64-bit)
-            reservation_key = cls.safe_unpack('<Q', entry, 16)[0]
-
-            # Byte 2: Reservation Status
-            rcsts = entry[2]
-            holds_reservation = bool(rcsts & 0x1)
-
-            # Bytes 8-15: Host Identifier (64-bit)
-            host_identifier = cls.safe_unpack('<Q', entry, 8)[0]
-
             registrants.append({
                 'controller_id': controller_id,
-                'holds_reservation': holds_reservation,
+                'holds_reservation': bool(rcsts & 0x1),
                 'reservation_key': reservation_key,
                 'host_identifier': host_identifier,
                 'host_identifier_size': 64
@@ -153,43 +139,32 @@ class ReservationDataParser(BaseParser):
         Note: Only include registrants with valid controller IDs.
         """
         registrants = []
-        entry_size = 64
-
-        # If num_registrants is specified, only parse that many entries
-        max_entries = num_registrants if num_registrants is not None else len(data) // entry_size
-
-        for i in range(max_entries):
-            offset = i * entry_size
-            if offset + entry_size > len(data):
-                break
-
-            entry = data[offset:offset + entry_size]
-
-            # Bytes 0-1: Controller ID
-            controller_id = cls.safe_unpack('<H', entry, 0)[0]
+        num_entries = cls._count_registrants(data, num_registrants, _EXTENDED_REGISTRANT.size)
 
+        # Decode all complete entries in one pass over the buffer
+        entries = memoryview(data)[:num_entries * _EXTENDED_REGISTRANT.size]
+        for controller_id, rcsts, reservation_key, hostid_low, hostid_high in _EXTENDED_REGISTRANT.iter_unpack(entries):
             # Only process entries with valid controller IDs
             if controller_id == 0:
                 continue
 
-            # Bytes 8-15: Reservation Key (64-bit)
-            reservation_key = cls.safe_unpack('<Q', entry, 8)[0]
-
-            # Byte 2: Reservation Status
-            rcsts = entry[2]
-            holds_reservation = bool(rcsts & 0x1)
-
-            # Bytes 16-31: Host Identifier (128-bit)
-            host_identifier = cls.safe_unpack('<QQ', entry, 16)
-            # Convert to single 128-bit integer: high_64 << 64 | low_64
-            host_identifier = (host_identifier[1] << 64) | host_identifier[0]
-
             registrants.append({
                 'controller_id': controller_id,
-                'holds_reservation': holds_reservation,
+                'holds_reservation': bool(rcsts & 0x1),
                 'reservation_key': reservation_key,
-                'host_identifier': host_identifier,
+                # Convert to single 128-bit integer: high_64 << 64 | low_64
+                'host_identifier': (hostid_high << 64) | hostid_low,
                 'host_identifier_size': 128
             })
 
         return registrants
+
+    @staticmethod
+    def _count_registrants(data: bytes, num_registrants: int | None, entry_size: int) -> int:
+        """
+        Number of complete registrant entries to decode.
+
+        Limited to num_registrants when given, and always to the entries that fit in data.
+        """
+        available = len(data) // entry_size
+        return available if num_registrants is None else min(num_registrants, available)
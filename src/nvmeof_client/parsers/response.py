@@ -5,15 +5,37 @@ This module handles parsing of basic NVMe response structures and
 completion queue entries.
 """
 
+import struct
 from typing import Any
 from .base import BaseParser
 from ..exceptions import CommandError
 from ..protocol.status_codes import format_status_error
 
+# Completion queue entry: DW0(4) + DW1(4) + SQ_HEAD(2) + SQ_ID(2) + CID(2) + STATUS(2)
+_COMPLETION_QUEUE_ENTRY = struct.Struct('<LLHHHH')
+
 
 class ResponseParser(BaseParser):
     """Parser for NVMe response and completion data structures."""
 
+    @classmethod
+    def parse_command_id(cls, data: bytes) -> int:
+        """
+        Get the command ID of a completion queue entry without checking its status.
+
+        Used to match completions that may arrive out of order to their commands
+        before the full entry is parsed with parse_response().
+
+        Args:
+            data: Response payload
+
+        Returns:
+            Command ID (CID) from the completion queue entry
+        """
+        cls.validate_data_length(data, _COMPLETION_QUEUE_ENTRY.size, "NVMe completion queue entry")
+        command_id: int = _COMPLETION_QUEUE_ENTRY.unpack_from(data, 0)[4]
+        return command_id
+
     @classmethod
     def parse_response(cls, data: bytes, expected_command_id: int) -> dict[str, Any]:
         """
@@ -33,7 +55,7 @@ class ResponseParser(BaseParser):
 
         # Parse basic completion queue entry (16 bytes)
         # Format: DW0(4) + DW1(4) + SQ_HEAD(2) + SQ_ID(2) + CID(2) + STATUS(2)
-        dw0, dw1, sq_head, sq_id, command_id, status = cls.safe_unpack('<LLHHHH', data, 0)
+        dw0, dw1, sq_head, sq_id, command_id, status = _COMPLETION_QUEUE_ENTRY.unpack_from(data, 0)
 
         if command_id != expected_command_id:
             raise ValueError(
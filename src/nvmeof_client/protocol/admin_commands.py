@@ -11,6 +11,12 @@ from .constants import (
 )
 from .types import NVMeOpcode
 
+# DW0 (opcode, flags, command ID) and DW1 (namespace ID) of a submission queue entry
+_SQE_DW0_DW1 = struct.Struct('<BBHL')
+
+# DW10-11 of Set Features: FID/SV and the feature-specific value
+_SET_FEATURES_DW10_DW11 = struct.Struct('<LL')
+
 
 def pack_identify_command(command_id: int, cns: int, nsid: int = 0) -> bytes:
     """
@@ -116,22 +122,16 @@ def pack_set_features_command(command_id: int, feature_id: int, value: int, nsid
 
     # DW0: Command Dword 0 (use SGL mode for NVMe-oF TCP)
     # Bits 31:16: Command ID, Bits 15:14: PSDT (01b for SGL), Bits 13:8: Reserved, Bits 7:0: Opcode
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.SET_FEATURES, NVME_CMD_FLAGS_SGL, command_id)
-
     # DW1: namespace ID
-    struct.pack_into('<L', cmd, 4, nsid)
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.SET_FEATURES, NVME_CMD_FLAGS_SGL, command_id, nsid)
 
-    # DW8-9: SGL Entry 1 (zero for non-data commands)
-    # For non-data commands, SGL descriptor should be zero
-    struct.pack_into('<Q', cmd, 32, 0x0000000000000000)
+    # DW8-9: SGL Entry 1 (zero for non-data commands, left as allocated)
 
     # DW10: Feature Identifier and Save bit
     # Reference: Figure 401 - Bits 7:0 = FID, Bits 30:8 = Reserved, Bit 31 = SV
-    dw10 = (feature_id & 0xFF) | ((1 if save else 0) << 31)
-    struct.pack_into('<L', cmd, 40, dw10)
-
     # DW11: Feature-specific value
-    struct.pack_into('<L', cmd, 44, value)
+    dw10 = (feature_id & 0xFF) | ((1 if save else 0) << 31)
+    _SET_FEATURES_DW10_DW11.pack_into(cmd, 40, dw10, value)
 
     return bytes(cmd)
 
@@ -367,13 +367,11 @@ def pack_async_event_request_command(command_id: int) -> bytes:
 
     # DW0: Command Dword 0 (use SGL mode for NVMe-oF TCP)
     # Bits 31:16: Command ID, Bits 15:14: PSDT (01b for SGL), Bits 13:8: Reserved, Bits 7:0: Opcode
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.ASYNC_EVENT_REQUEST, NVME_CMD_FLAGS_SGL, command_id)
-
     # DW1: Reserved (no namespace for Asynchronous Event Request)
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.ASYNC_EVENT_REQUEST, NVME_CMD_FLAGS_SGL, command_id, 0)
 
-    # DW8-9: SGL Entry 1 (zero for non-data commands)
+    # DW8-9: SGL Entry 1 (zero for non-data commands, left as allocated)
     # Asynchronous Event Request is a non-data command
-    struct.pack_into('<Q', cmd, 32, 0x0000000000000000)
 
     # DW10-15: All reserved for Asynchronous Event Request command
     # Per spec: "All command specific fields are reserved"
@@ -17,6 +17,15 @@ from ..models import (
     ReservationType,
 )
 
+# Reservation commands are packed in two calls: DW0-DW1, then SGL Entry 1 length
+# and type (bytes 32-39) running straight into DW10 (and DW11 for Report)
+_SQE_DW0_DW1 = struct.Struct('<BBHL')        # Opcode, flags, command ID, NSID
+_SGL_DW10 = struct.Struct('<L3xBL')          # SGL length, reserved, SGL type, DW10
+_SGL_DW10_DW11 = struct.Struct('<L3xBLL')    # SGL length, reserved, SGL type, DW10, DW11
+
+# SGL Entry 1 (bytes 32-39) for in-capsule data: length, reserved, SGL type
+_SGL_DATA_BLOCK = struct.Struct('<L3xB')
+
 
 def pack_nvme_read_command(command_id: int, nsid: int, start_lba: int, block_count: int,
                            logical_block_size: int = NVME_SECTOR_SIZE) -> bytes:
@@ -100,9 +109,7 @@ def pack_nvme_write_command(command_id: int, nsid: int, start_lba: int, block_co
     # Bytes 32-35: Length (4 bytes, little endian)
     # Bytes 36-38: Reserved (3 bytes)
     # Byte 39: Type(upper 4 bits) + Subtype(lower 4 bits) = 0x01 (Data Block with Offset)
-    struct.pack_into('<L', cmd, 32, data_length)          # Length: data_length bytes
-    struct.pack_into('<BBB', cmd, 36, 0x00, 0x00, 0x00)   # Reserved
-    struct.pack_into('<B', cmd, 39, 0x01)                 # Type=0, Subtype=1 (Data Block with Offset)
+    _SGL_DATA_BLOCK.pack_into(cmd, 32, data_length, 0x01)
 
     # DW10-11: Starting LBA (64-bit)
     struct.pack_into('<Q', cmd, 40, start_lba)
@@ -116,6 +123,35 @@ def pack_nvme_write_command(command_id: int, nsid: int, start_lba: int, block_co
     return bytes(cmd)
 
 
+def pack_nvme_data_command(opcode: int, command_id: int, nsid: int, data_length: int) -> bytes:
+    """
+    Pack a generic NVMe command that carries in-capsule data.
+
+    SGL Entry 1 is a Data Block with Offset descriptor, the same format the Write
+    command uses, so the data follows the command in the same Command PDU.
+
+    Args:
+        opcode: NVMe command opcode
+        command_id: Command identifier
+        nsid: Namespace identifier
+        data_length: Length of the in-capsule data in bytes
+
+    Returns:
+        64-byte NVMe command with SGL descriptor
+
+    Reference: NVMe-oF TCP Transport Specification Table 7 "Command PDU"
+    """
+    cmd = bytearray(NVME_COMMAND_SIZE)
+
+    # DW0: opcode, flags=SGL mode, command_id; DW1: namespace ID
+    _SQE_DW0_DW1.pack_into(cmd, 0, opcode, NVME_CMD_FLAGS_SGL, command_id, nsid)
+
+    # DW6-9: SGL Entry 1, Type=0, Subtype=1 (Data Block with Offset)
+    _SGL_DATA_BLOCK.pack_into(cmd, 32, data_length, 0x01)
+
+    return bytes(cmd)
+
+
 def pack_nvme_write_command_host_data(command_id: int, nsid: int, start_lba: int,
                                       block_count: int, logical_block_size: int,
                                       data_length: int) -> bytes:
@@ -347,19 +383,8 @@ def pack_nvme_reservation_register_command(command_id: int, nsid: int, reservati
     """
     cmd = bytearray(NVME_COMMAND_SIZE)
 
-    # DW0: opcode=0x0D, flags=SGL mode, command_id
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.RESERVATION_REGISTER, NVME_CMD_FLAGS_SGL, command_id)
-
-    # DW1: namespace ID
-    struct.pack_into('<L', cmd, 4, nsid)
-
-    # DW6-9: SGL Entry 1 for data transfer (16 bytes for reservation data)
-    # SGL descriptor format for NVMe-oF TCP (8 bytes total):
-    # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
-    # Data-out operation (host to controller): use Data Block with Offset (0x01)
-    struct.pack_into('<L', cmd, 32, 16)                  # Length: 16 bytes
-    struct.pack_into('<BBB', cmd, 36, 0x00, 0x00, 0x00)  # Reserved
-    struct.pack_into('<B', cmd, 39, 0x01)                # Type=0, Subtype=1 (Data Block with Offset)
+    # DW0: opcode=0x0D, flags=SGL mode, command_id; DW1: namespace ID
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.RESERVATION_REGISTER, NVME_CMD_FLAGS_SGL, command_id, nsid)
 
     # DW10: Build the complete DW10 field per Figure 573
     # Bits 30-31: CPTPL (Change Persist Through Power Loss)
@@ -372,7 +397,14 @@ def pack_nvme_reservation_register_command(command_id: int, nsid: int, reservati
         dw10 |= (1 << 3)  # Bit 3: IEKEY
     dw10 |= ((cptpl & 0x3) << 30)  # Bits 30-31: CPTPL
 
-    struct.pack_into('<L', cmd, 40, dw10)
+    # DW6-9: SGL Entry 1 for data transfer (16 bytes for reservation data), then DW10
+    # SGL descriptor format for NVMe-oF TCP (8 bytes total):
+    # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
+    # Data-out operation (host to controller): use Data Block with Offset (0x01)
+    _SGL_DW10.pack_into(cmd, 32,
+                        16,    # Length: 16 bytes
+                        0x01,  # Type=0, Subtype=1 (Data Block with Offset)
+                        dw10)
 
     return bytes(cmd)
 
@@ -395,35 +427,33 @@ def pack_nvme_reservation_report_command(command_id: int, nsid: int, data_length
     """
     cmd = bytearray(NVME_COMMAND_SIZE)
 
-    # DW0: opcode=0x0E, flags=SGL mode, command_id
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.RESERVATION_REPORT, NVME_CMD_FLAGS_SGL, command_id)
-
-    # DW1: namespace ID
-    struct.pack_into('<L', cmd, 4, nsid)
-
-    # DW6-9: SGL Entry 1 for data transfer (controller to host)
-    # SGL descriptor format for NVMe-oF TCP (8 bytes total):
-    # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
-    struct.pack_into('<L', cmd, 32, data_length)         # Length in bytes
-    struct.pack_into('<BBB', cmd, 36, 0x00, 0x00, 0x00)  # Reserved
-    struct.pack_into('<B', cmd, 39, 0x5A)                # Type=5, Subtype=A
+    # DW0: opcode=0x0E, flags=SGL mode, command_id; DW1: namespace ID
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.RESERVATION_REPORT, NVME_CMD_FLAGS_SGL, command_id, nsid)
 
     # DW10: Number of Dwords (NUMD) - 0-based value
     # Reference: NVM Command Set Specification 1.0c, Figure 295
     numd = (data_length // 4) - 1
-    struct.pack_into('<L', cmd, 40, numd)
 
     # DW11: Extended Data Structure (EDS) field
     # Reference: NVM Express Base Specification 2.1, Figure 580
     # EDS=1 requests extended data structure with 128-bit host identifiers
     # EDS=0 requests standard data structure with 64-bit host identifiers
-    struct.pack_into('<L', cmd, 44, eds & 0x1)
+    eds &= 0x1
+
+    # DW6-9: SGL Entry 1 for data transfer (controller to host), then DW10 and DW11
+    # SGL descriptor format for NVMe-oF TCP (8 bytes total):
+    # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
+    _SGL_DW10_DW11.pack_into(cmd, 32,
+                             data_length,  # Length in bytes
+                             0x5A,         # Type=5, Subtype=A
+                             numd,
+                             eds)
 
     return bytes(cmd)
 
 
-def pack_nvme_reservation_acquire_command(command_id: int, nsid: int, reservation_action: ReservationAction,
-                                          reservation_type: ReservationType) -> bytes:
+def pack_nvme_reservation_acquire_command(command_id: int, nsid: int, reservation_action: ReservationAction | int,
+                                          reservation_type: ReservationType | int) -> bytes:
     """
     Pack NVMe Reservation Acquire Command.
 
@@ -444,31 +474,28 @@ def pack_nvme_reservation_acquire_command(command_id: int, nsid: int, reservatio
     """
     cmd = bytearray(NVME_COMMAND_SIZE)
 
-    # DW0: opcode=0x11, flags=SGL mode, command_id
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.RESERVATION_ACQUIRE, NVME_CMD_FLAGS_SGL, command_id)
+    # DW0: opcode=0x11, flags=SGL mode, command_id; DW1: namespace ID
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.RESERVATION_ACQUIRE, NVME_CMD_FLAGS_SGL, command_id, nsid)
 
-    # DW1: namespace ID
-    struct.pack_into('<L', cmd, 4, nsid)
+    # DW10: Reservation Action (RACQA) and Reservation Type (RTYPE)
+    # Bits 2:0: Action, Bits 7:3: Reserved, Bits 15:8: Reservation Type
+    # Reference: NVM Command Set Specification 1.0c, Figure 290
+    dw10 = (reservation_action & 0x7) | ((reservation_type & 0xFF) << 8)
 
-    # DW6-9: SGL Entry 1 for data transfer (16 bytes for reservation data)
+    # DW6-9: SGL Entry 1 for data transfer (16 bytes for reservation data), then DW10
     # SGL descriptor format for NVMe-oF TCP (8 bytes total):
     # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
     # Data-out operation (host to controller): use Data Block with Offset (0x01)
-    struct.pack_into('<L', cmd, 32, 16)                  # Length: 16 bytes
-    struct.pack_into('<BBB', cmd, 36, 0x00, 0x00, 0x00)  # Reserved
-    struct.pack_into('<B', cmd, 39, 0x01)                # Type=0, Subtype=1 (Data Block with Offset)
-
-    # DW10: Reservation Action (RACQA) and Reservation Type (RTYPE)
-    # Bits 2:0: Action, Bits 7:3: Reserved, Bits 15:8: Reservation Type
-    # Reference: NVM Command Set Specification 1.0c, Figure 290
-    dw10 = (reservation_action.value & 0x7) | ((reservation_type.value & 0xFF) << 8)
-    struct.pack_into('<L', cmd, 40, dw10)
+    _SGL_DW10.pack_into(cmd, 32,
+                        16,    # Length: 16 bytes
+                        0x01,  # Type=0, Subtype=1 (Data Block with Offset)
+                        dw10)
 
     return bytes(cmd)
 
 
-def pack_nvme_reservation_release_command(command_id: int, nsid: int, reservation_action: ReservationAction,
-                                          reservation_type: ReservationType) -> bytes:
+def pack_nvme_reservation_release_command(command_id: int, nsid: int, reservation_action: ReservationAction | int,
+                                          reservation_type: ReservationType | int) -> bytes:
     """
     Pack NVMe Reservation Release Command.
 
@@ -489,24 +516,21 @@ def pack_nvme_reservation_release_command(command_id: int, nsid: int, reservatio
     """
     cmd = bytearray(NVME_COMMAND_SIZE)
 
-    # DW0: opcode=0x15, flags=SGL mode, command_id
-    struct.pack_into('<BBH', cmd, 0, NVMeOpcode.RESERVATION_RELEASE, NVME_CMD_FLAGS_SGL, command_id)
+    # DW0: opcode=0x15, flags=SGL mode, command_id; DW1: namespace ID
+    _SQE_DW0_DW1.pack_into(cmd, 0, NVMeOpcode.RESERVATION_RELEASE, NVME_CMD_FLAGS_SGL, command_id, nsid)
 
-    # DW1: namespace ID
-    struct.pack_into('<L', cmd, 4, nsid)
+    # DW10: Reservation Action (RRELA) and Reservation Type (RTYPE)
+    # Bits 2:0: Action, Bits 7:3: Reserved, Bits 15:8: Reservation Type
+    # Reference: NVM Command Set Specification 1.0c, Figure 293
+    dw10 = (reservation_action & 0x7) | ((reservation_type & 0xFF) << 8)
 
-    # DW6-9: SGL Entry 1 for data transfer (8 bytes for reservation data)
+    # DW6-9: SGL Entry 1 for data transfer (8 bytes for reservation data), then DW10
     # SGL descriptor format for NVMe-oF TCP (8 bytes total):
     # Reference: NVM Express over Fabrics 1.1a, Section 4.2 "SGL Support"
     # Data-out operation (host to controller): use Data Block with Offset (0x01)
-    struct.pack_into('<L', cmd, 32, 8)                   # Length: 8 bytes
-    struct.pack_into('<BBB', cmd, 36, 0x00, 0x00, 0x00)  # Reserved
-    struct.pack_into('<B', cmd, 39, 0x01)                # Type=0, Subtype=1 (Data Block with Offset)
-
-    # DW10: Reservation Action (RRELA) and Reservation Type (RTYPE)
-    # Bits 2:0: Action, Bits 7:3: Reserved, Bits 15:8: Reservation Type
-    # Reference: NVM Command Set Specification 1.0c, Figure 293
-    dw10 = (reservation_action.value & 0x7) | ((reservation_type.value & 0xFF) << 8)
-    struct.pack_into('<L', cmd, 40, dw10)
+    _SGL_DW10.pack_into(cmd, 32,
+                        8,     # Length: 8 bytes
+                        0x01,  # Type=0, Subtype=1 (Data Block with Offset)
+                        dw10)
 
     return bytes(cmd)
@@ -15,6 +15,10 @@ from .types import (
     PDUType,
 )
 
+# Common header: type, flags, HLEN, PDO, then 24-bit PLEN followed by a reserved byte.
+# PLEN and the reserved byte are handled as one little-endian dword masked to 24 bits.
+_PDU_HEADER = struct.Struct('<BBBBL')
+
 
 def pack_pdu_header(pdu_type: PDUType, flags: int, hlen: int, pdo: int, plen: int) -> bytes:
     """
@@ -32,15 +36,7 @@ def pack_pdu_header(pdu_type: PDUType, flags: int, hlen: int, pdo: int, plen: in
 
     Reference: NVMe-oF TCP Transport Specification Section 3.3.1
     """
-    return struct.pack('<BBBBBBBB',
-                       pdu_type,           # PDU Type
-                       flags,              # Flags
-                       hlen,               # Header Length
-                       pdo,                # PDU Data Offset
-                       plen & 0xFF,        # PDU Length (bytes 0-2)
-                       (plen >> 8) & 0xFF,
-                       (plen >> 16) & 0xFF,
-                       0)                  # Reserved
+    return _PDU_HEADER.pack(pdu_type, flags, hlen, pdo, plen & 0xFFFFFF)
 
 
 def unpack_pdu_header(data: bytes) -> PDUHeader:
@@ -61,17 +57,14 @@ def unpack_pdu_header(data: bytes) -> PDUHeader:
     if len(data) != 8:
         raise ValueError(f"PDU header must be exactly 8 bytes, got {len(data)}")
 
-    pdu_type, flags, hlen, pdo, plen0, plen1, plen2, reserved = struct.unpack('<BBBBBBBB', data)
-
-    # Reconstruct 24-bit PDU length
-    plen = plen0 | (plen1 << 8) | (plen2 << 16)
+    pdu_type, flags, hlen, pdo, plen = _PDU_HEADER.unpack(data)
 
     return PDUHeader(
         pdu_type=pdu_type,
         flags=flags,
         hlen=hlen,
         pdo=pdo,
-        plen=plen
+        plen=plen & 0xFFFFFF  # Drop the reserved byte above the 24-bit PDU length
     )
 
 
@@ -8,6 +8,11 @@ to simulate target responses without requiring a live target.
 import struct
 from nvmeof_client.protocol import PDUType
 
+# Reservation report layouts (NVM Command Set Specification, Figures 582-584)
+_RESERVATION_REPORT_HEADER = struct.Struct('<LBH2xB14x')  # GEN, RTYPE, REGCTL, PTPLS
+_STANDARD_REGISTRANT = struct.Struct('<HB5xQQ')         # CNTLID, RCSTS, HOSTID, RKEY
+_EXTENDED_REGISTRANT = struct.Struct('<HB5xQQQ32x')     # CNTLID, RCSTS, RKEY, HOSTID (128-bit)
+
 
 def create_icresp_pdu():
     """Create a mock ICRESP (Initialize Connection Response) PDU."""
@@ -50,23 +55,8 @@ def create_reservation_report_data(generation: int = 1, reservation_type: int =
     """Create mock reservation report data."""
     if registered_controllers is None:
         registered_controllers = []
-
-    # Create a proper 24-byte header according to NVMe spec Figure 582
-    header = bytearray(24)
-
-    # Bytes 0-3: Generation counter (32-bit LE)
-    struct.pack_into('<L', header, 0, generation)
-
-    # Byte 4: Reservation Type (RTYPE)
-    header[4] = reservation_type
-
-    # Bytes 5-6: Number of registered controllers (16-bit LE)
-    struct.pack_into('<H', header, 5, len(registered_controllers))
-
-    # Bytes 7-8: Reserved
-    # Byte 9: Persist Through Power Loss State (PTPLS)
-    header[9] = 0
-    # Bytes 10-23: Reserved
+    # Header count covers the caller's list only, not an implicitly added holder
+    num_registered = len(registered_controllers)
 
     # If there's a reservation holder, ensure they're in the registered controllers list
     if reservation_holder > 0:
@@ -75,45 +65,29 @@ def create_reservation_report_data(generation: int = 1, reservation_type: int =
         if not holder_found:
             registered_controllers = [(reservation_holder, 0x123456789ABCDEF0)] + list(registered_controllers)
 
-    # Add registered controller entries based on format
-    controller_entries = b''
-    entry_size = 64 if extended_format else 24
-
-    for i, (controller_id, key) in enumerate(registered_controllers):
-        entry = bytearray(entry_size)
+    # Extended format adds 40 reserved bytes between header and registrant data
+    if extended_format:
+        entry_struct, offset = _EXTENDED_REGISTRANT, 64
+    else:
+        entry_struct, offset = _STANDARD_REGISTRANT, 24
+    data = bytearray(offset + len(registered_controllers) * entry_struct.size)
 
-        # Bytes 0-1: Controller ID
-        struct.pack_into('<H', entry, 0, controller_id)
+    # 24-byte header according to NVMe spec Figure 582; PTPLS (byte 9) = 0
+    _RESERVATION_REPORT_HEADER.pack_into(data, 0, generation, reservation_type, num_registered, 0)
 
-        # Byte 2: Reservation Status (set bit 0 if this controller holds reservation)
+    for controller_id, key in registered_controllers:
+        # Reservation Status: bit 0 set if this controller holds the reservation
         rcsts = 1 if controller_id == reservation_holder else 0
-        struct.pack_into('<B', entry, 2, rcsts)
 
         if extended_format:
-            # Extended format (Figure 584): 64 bytes per entry
-            # Bytes 8-15: Reservation Key (64-bit)
-            struct.pack_into('<Q', entry, 8, key)
-            # Bytes 16-31: Host Identifier (128-bit)
-            # For testing, use key as lower 64 bits and key+1 as upper 64 bits
-            host_id_low = key
-            host_id_high = key + 1
-            struct.pack_into('<Q', entry, 16, host_id_low)   # Lower 64 bits
-            struct.pack_into('<Q', entry, 24, host_id_high)  # Upper 64 bits
+            # Host Identifier (128-bit): key as lower 64 bits and key+1 as upper 64 bits
+            entry_struct.pack_into(data, offset, controller_id, rcsts, key, key, key + 1)
         else:
-            # Standard format (Figure 583): 24 bytes per entry
-            # Bytes 8-15: Host Identifier (64-bit)
-            struct.pack_into('<Q', entry, 8, key)  # Use key as host ID
-            # Bytes 16-23: Reservation Key (64-bit)
-            struct.pack_into('<Q', entry, 16, key)
-
-        controller_entries += bytes(entry)
+            # Standard format uses the key as the 64-bit Host Identifier too
+            entry_struct.pack_into(data, offset, controller_id, rcsts, key, key)
+        offset += entry_struct.size
 
-    # For extended format, add 40 reserved bytes between header and registrant data
-    if extended_format:
-        reserved_bytes = b'\x00' * 40
-        return bytes(header) + reserved_bytes + controller_entries
-    else:
-        return bytes(header) + controller_entries
+    return bytes(data)
 
 
 def create_identify_controller_data():
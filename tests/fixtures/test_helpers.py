@@ -4,6 +4,8 @@ Test Helper Functions
 Common utilities and helpers used across multiple test modules.
 """
 
+import dataclasses
+import functools
 import os
 import socket
 import struct
@@ -17,6 +19,9 @@ from nvmeof_client.models import (
     ReservationType,
 )
 
+# SQE dwords 0-1: opcode, flags, command ID, namespace ID
+_SQE_DW0_DW1 = struct.Struct('<BBHL')
+
 
 def get_test_target_config():
     """Get test target configuration from environment variables."""
@@ -34,6 +39,47 @@ def should_skip_integration_tests():
     return os.getenv('NVMEOF_SKIP_INTEGRATION', '').lower() in ('1', 'true', 'yes')
 
 
+@functools.lru_cache(maxsize=256)
+def fill_block(pattern: bytes, block_size: int) -> bytes:
+    """Repeat pattern to fill exactly one block of block_size bytes (cached, the result is immutable)."""
+    return (pattern * (block_size // len(pattern) + 1))[:block_size]
+
+
+@functools.lru_cache(maxsize=16)
+def zero_block(size: int) -> bytes:
+    """Get a buffer of size zero bytes, shared between callers."""
+    return bytes(size)
+
+
+def is_all_zero(data: bytes) -> bool:
+    """Check that data contains only zero bytes without building a zero buffer to compare against."""
+    return not data.lstrip(b'\x00')
+
+
+def first_mismatched_block(data: bytes, expected: bytes, block_size: int) -> int:
+    """
+    Find the first logical block where data differs from expected.
+
+    Compares the whole buffers in one go and only walks the blocks when they differ.
+    Returns the block index, or -1 if the buffers are equal.
+    """
+    if data == expected:
+        return -1
+    data_view, expected_view = memoryview(data), memoryview(expected)
+    for index, offset in enumerate(range(0, max(len(data), len(expected)), block_size)):
+        if data_view[offset:offset + block_size] != expected_view[offset:offset + block_size]:
+            return index
+    return -1
+
+
+def assert_field_types(obj) -> None:
+    """Assert every dataclass field of obj holds a value of its annotated type."""
+    for f in dataclasses.fields(obj):
+        value = getattr(obj, f.name)
+        assert isinstance(value, f.type), \
+            f"{type(obj).__name__}.{f.name}: expected {f.type}, got {value!r}"
+
+
 def create_mock_client(connected: bool = True, discovery_mode: bool = False):
     """Create a mock NVMeoFClient for testing."""
     client = Mock(spec=NVMeoFClient)
@@ -65,11 +111,9 @@ def assert_command_structure(test_case, command_bytes: bytes, expected_opcode: i
     """Assert that a command has the expected structure."""
     test_case.assertEqual(len(command_bytes), expected_size)
 
-    # Check opcode (byte 0)
-    test_case.assertEqual(command_bytes[0], expected_opcode)
-
-    # Check namespace ID (bytes 4-7)
-    nsid = struct.unpack('<L', command_bytes[4:8])[0]
+    # Check opcode (byte 0) and namespace ID (bytes 4-7)
+    opcode, _, _, nsid = _SQE_DW0_DW1.unpack_from(command_bytes)
+    test_case.assertEqual(opcode, expected_opcode)
     test_case.assertEqual(nsid, expected_nsid)
 
 
@@ -4,7 +4,11 @@ Pytest configuration for integration tests
 Provides fixtures and configuration for tests that require a live NVMe-oF target.
 """
 
+import fcntl
+import hashlib
 import os
+from dataclasses import dataclass
+
 import pytest
 from nvmeof_client.client import NVMeoFClient
 from ..fixtures.test_helpers import (
@@ -14,6 +18,10 @@ from ..fixtures.test_helpers import (
 )
 
 
+# Number of logical blocks covered by the block_buffer fixture
+BLOCK_BUFFER_BLOCKS = 16
+
+
 def pytest_addoption(parser):
     """Add custom command line options."""
     parser.addoption(
@@ -35,6 +43,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "manual: mark test as requiring manual intervention (skipped by default)"
     )
+    config.addinivalue_line(
+        "markers", "fresh_nsids: re-query the active namespace list instead of using the session cache"
+    )
+    config.addinivalue_line(
+        "markers", "readonly: test never modifies the test namespace and runs without namespace_lock"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -71,9 +85,13 @@ def target_available(target_config):
     return True
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(target_config, target_available):
-    """Create a connected NVMe-oF client for testing."""
+    """
+    Create a connected NVMe-oF client shared by the tests of a module.
+
+    Connection lifecycle itself is covered by test_connect_disconnect.
+    """
     client = NVMeoFClient(
         target_config['host'],
         port=target_config['port'],
@@ -88,9 +106,9 @@ def client(target_config, target_available):
             client.disconnect()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def discovery_client(target_config, target_available):
-    """Create a client connected to discovery subsystem."""
+    """Create a client connected to discovery subsystem, shared by the tests of a module."""
     client = NVMeoFClient(
         target_config['host'],
         "nqn.2014-08.org.nvmexpress.discovery",
@@ -109,7 +127,12 @@ def discovery_client(target_config, target_available):
 
 @pytest.fixture
 def nvme_client(target_config, target_available):
-    """Create a client connected to NVMe subsystem for I/O operations."""
+    """
+    Create a client connected to NVMe subsystem for I/O operations.
+
+    Kept per-test: tests leave controller state behind (outstanding async
+    event requests, I/O queues, reservations) that must not leak into others.
+    """
     client = NVMeoFClient(
         target_config['host'],
         target_config['nqn'],
@@ -126,12 +149,147 @@ def nvme_client(target_config, target_available):
             client.disconnect()
 
 
+@pytest.fixture(scope="module")
+def second_nvme_client(target_config, target_available):
+    """
+    Additional NVM subsystem connection shared by the tests of a module.
+
+    Used by tests that need an independent controller session next to
+    nvme_client, e.g. to check data written by another session.
+    """
+    client = NVMeoFClient(
+        target_config['host'],
+        target_config['nqn'],
+        port=target_config['port'],
+        timeout=target_config['timeout']
+    )
+
+    try:
+        client.connect()
+        yield client
+    finally:
+        if client.is_connected:
+            client.disconnect()
+
+
+@pytest.fixture(scope="session")
+def session_nvme_client(target_config, target_available):
+    """
+    NVMe subsystem connection shared by session-scoped fixtures.
+
+    Used only to query data that does not change during a test run
+    (namespace geometry, active namespace list). Tests should use nvme_client.
+    """
+    client = NVMeoFClient(
+        target_config['host'],
+        target_config['nqn'],
+        port=target_config['port'],
+        timeout=target_config['timeout']
+    )
+
+    try:
+        client.connect()
+        yield client
+    finally:
+        if client.is_connected:
+            client.disconnect()
+
+
+@pytest.fixture(scope="session")
+def session_active_nsids(session_nvme_client):
+    """Active namespace ID list of the configured subsystem, queried once per session."""
+    return session_nvme_client.list_namespaces()
+
+
 @pytest.fixture
+def active_nsids(request, session_active_nsids):
+    """
+    Active namespace ID list for the configured subsystem.
+
+    Uses the session-cached list unless the test is marked with
+    ``@pytest.mark.fresh_nsids``, e.g. after attaching or detaching namespaces.
+    """
+    if request.node.get_closest_marker("fresh_nsids"):
+        return request.getfixturevalue("nvme_client").list_namespaces()
+    return list(session_active_nsids)
+
+
+@pytest.fixture(scope="session")
 def test_namespace_id():
     """Get namespace ID for testing."""
     return int(os.getenv('NVMEOF_TEST_NSID', '1'))
 
 
+@dataclass(frozen=True)
+class NamespaceParams:
+    """Geometry of the test namespace."""
+
+    block_size: int       # Logical block size in bytes
+    namespace_size: int   # NSZE: namespace size in logical blocks
+
+
+@pytest.fixture(scope="session")
+def ns_params(session_nvme_client, test_namespace_id):
+    """Test namespace geometry, identified once per session."""
+    ns_data = session_nvme_client.identify_namespace(test_namespace_id)
+    assert 'logical_block_size' in ns_data, "identify_namespace() should report logical_block_size"
+    return NamespaceParams(
+        block_size=ns_data['logical_block_size'],
+        namespace_size=ns_data.get('nsze', 0)
+    )
+
+
+@pytest.fixture(scope="session")
+def block_buffer(ns_params):
+    """
+    Random test data spanning BLOCK_BUFFER_BLOCKS logical blocks, generated once per session.
+
+    Slice it per block (``block_buffer[i * block_size:(i + 1) * block_size]``) to get
+    distinct data for different LBAs without building patterns in every test.
+    """
+    return memoryview(os.urandom(ns_params.block_size * BLOCK_BUFFER_BLOCKS))
+
+
+@pytest.fixture
+def unique_block_data(request, ns_params, block_buffer):
+    """
+    Build block data from block_buffer that no other test or parameter writes.
+
+    Returns ``make(num_blocks, first_block=0)``: the given blocks of the session buffer,
+    each stamped with a digest of the test's node ID. A write the target silently drops
+    then cannot read back as data another test left at the same LBA.
+    """
+    block_size = ns_params.block_size
+    tag = hashlib.sha256(request.node.nodeid.encode()).digest()
+
+    def make(num_blocks, first_block=0):
+        data = bytearray(block_buffer[first_block * block_size:(first_block + num_blocks) * block_size])
+        for offset in range(0, len(data), block_size):
+            data[offset:offset + len(tag)] = tag
+        return bytes(data)
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def namespace_lock(request, tmp_path_factory):
+    """
+    Serialize tests that modify the test namespace across pytest-xdist workers.
+
+    Holds an exclusive lock file shared by all workers for the duration of the test.
+    Tests marked ``@pytest.mark.readonly`` and non-distributed runs skip the lock.
+    """
+    if request.node.get_closest_marker("readonly") or not os.getenv("PYTEST_XDIST_WORKER"):
+        yield
+        return
+
+    # basetemp is per worker; its parent directory is shared by the whole run
+    lock_path = tmp_path_factory.getbasetemp().parent / "namespace.lock"
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield  # Lock is released when the file is closed
+
+
 @pytest.fixture
 def test_reservation_key():
     """Get test reservation key."""
@@ -15,6 +15,7 @@ from nvmeof_client.models import (
 
 @pytest.mark.integration
 @pytest.mark.slow
+@pytest.mark.timeout(30)
 class TestAsyncEventBasic:
     """Test basic async event functionality."""
 
@@ -238,6 +239,7 @@ class TestAsyncEventManual:
 
 @pytest.mark.integration
 @pytest.mark.slow
+@pytest.mark.timeout(30)
 class TestAsyncEventWorkflow:
     """Test complete async event workflows."""
 
@@ -4,6 +4,7 @@ Unit tests for ANA (Asymmetric Namespace Access) functionality
 Tests ANA models, enums, and parser implementation.
 """
 
+import dataclasses
 import struct
 import unittest
 from nvmeof_client.models import (
@@ -53,6 +54,17 @@ class TestANAGroupDescriptor(unittest.TestCase):
         self.assertEqual(descriptor.ana_state, ANAState.OPTIMIZED)
         self.assertEqual(descriptor.namespace_ids, [1, 2])
 
+    def test_descriptor_is_immutable(self):
+        """Test descriptors are frozen so the precomputed flags cannot go stale."""
+        descriptor = ANAGroupDescriptor(1, 1, 0, ANAState.OPTIMIZED, [1])
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            descriptor.ana_state = ANAState.INACCESSIBLE
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            descriptor.is_optimized = False
+        self.assertTrue(descriptor.is_optimized)
+        self.assertEqual(descriptor, ANAGroupDescriptor(1, 1, 0, ANAState.OPTIMIZED, [1]))
+
     def test_descriptor_is_accessible(self):
         """Test is_accessible property for different states."""
         # Accessible states
@@ -147,6 +159,18 @@ class TestANALogPage(unittest.TestCase):
         group = log_page.get_group(99)
         self.assertIsNone(group)
 
+    def test_lookup_indexes_built_on_first_use(self):
+        """Test that group and NSID indexes are only built when a lookup needs them."""
+        groups = [ANAGroupDescriptor(1, 2, 100, ANAState.OPTIMIZED, [1, 2])]
+        log_page = ANALogPage(change_count=200, num_ana_group_descriptors=1, groups=groups)
+
+        self.assertNotIn('_group_index', vars(log_page))
+        self.assertNotIn('_nsid_index', vars(log_page))
+
+        self.assertEqual(log_page.get_namespace_state(2), ANAState.OPTIMIZED)
+        self.assertIn('_nsid_index', vars(log_page))
+        self.assertNotIn('_group_index', vars(log_page))
+
     def test_get_namespace_state(self):
         """Test retrieving ANA state for a specific namespace."""
         groups = [
@@ -172,6 +196,23 @@ class TestANALogPage(unittest.TestCase):
         state = log_page.get_namespace_state(99)
         self.assertIsNone(state)
 
+    def test_get_group_for_namespace(self):
+        """Test retrieving the ANA group that contains a namespace."""
+        groups = [
+            ANAGroupDescriptor(1, 2, 100, ANAState.OPTIMIZED, [1, 2]),
+            ANAGroupDescriptor(2, 1, 50, ANAState.INACCESSIBLE, [3])
+        ]
+
+        log_page = ANALogPage(
+            change_count=200,
+            num_ana_group_descriptors=2,
+            groups=groups
+        )
+
+        self.assertIs(log_page.get_group_for_namespace(2), groups[0])
+        self.assertIs(log_page.get_group_for_namespace(3), groups[1])
+        self.assertIsNone(log_page.get_group_for_namespace(99))
+
     def test_optimized_groups_property(self):
         """Test optimized_groups property."""
         groups = [
@@ -188,6 +229,7 @@ class TestANALogPage(unittest.TestCase):
         )
 
         optimized = log_page.optimized_groups
+        self.assertIsInstance(optimized, tuple)
         self.assertEqual(len(optimized), 2)
         self.assertEqual(optimized[0].ana_group_id, 1)
         self.assertEqual(optimized[1].ana_group_id, 3)
@@ -208,10 +250,14 @@ class TestANALogPage(unittest.TestCase):
         )
 
         accessible = log_page.accessible_groups
+        self.assertIsInstance(accessible, tuple)
         self.assertEqual(len(accessible), 2)
         self.assertEqual(accessible[0].ana_group_id, 1)
         self.assertEqual(accessible[1].ana_group_id, 2)
 
+        # Result is computed once and reused on subsequent reads
+        self.assertIs(log_page.accessible_groups, accessible)
+
 
 class TestANALogPageParser(unittest.TestCase):
     """Test ANA Log Page parser."""
@@ -20,6 +20,10 @@ from nvmeof_client.protocol import (
     FeatureIdentifier
 )
 
+# Command fields are read in place with unpack_from instead of slicing cmd
+_CID = struct.Struct('<H')    # Command identifier, byte offset 2
+_DWORD = struct.Struct('<L')  # One command dword (NSID at 4, DW10 at 40, DW11 at 44)
+
 
 class TestAsyncEventModels(unittest.TestCase):
     """Test AsyncEvent data models."""
@@ -191,6 +195,26 @@ class TestAsyncEventParser(unittest.TestCase):
 
         self.assertEqual(result['event_specific_param'], 0x12345678)
 
+    def test_repeated_events_share_description(self):
+        """Test that identical events reuse one description string."""
+        for dw0 in (0x02 | (0x03 << 8) | (0x0C << 16),   # Known Notice code (table lookup)
+                    0x00 | (0x05 << 8) | (0x01 << 16)):  # Error Status (formatted once, then cached)
+            with self.subTest(dw0=hex(dw0)):
+                first = AsyncEventParser.parse_async_event_completion(dw0, 0)
+                second = AsyncEventParser.parse_async_event_completion(dw0, 0)
+                self.assertIs(first['description'], second['description'])
+
+    def test_repeated_events_return_independent_dicts(self):
+        """Test that cached decoding does not share the returned dictionary between calls."""
+        dw0 = 0x02 | (0x03 << 8) | (0x0C << 16)
+
+        first = AsyncEventParser.parse_async_event_completion(dw0, 0)
+        first['event_info'] = 0xFF
+        second = AsyncEventParser.parse_async_event_completion(dw0, 0)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second['event_info'], 0x03)
+
     def test_parse_to_object(self):
         """Test parsing to AsyncEvent object."""
         dw0 = 0x02 | (0x03 << 8) | (0x0C << 16)
@@ -224,15 +248,15 @@ class TestAsyncEventCommands(unittest.TestCase):
         self.assertEqual(opcode, NVMeOpcode.SET_FEATURES)
 
         # Check command ID (bytes 2-3)
-        parsed_cmd_id = struct.unpack('<H', cmd[2:4])[0]
+        parsed_cmd_id = _CID.unpack_from(cmd, 2)[0]
         self.assertEqual(parsed_cmd_id, cmd_id)
 
         # Check namespace ID (bytes 4-7) should be 0
-        nsid = struct.unpack('<L', cmd[4:8])[0]
+        nsid = _DWORD.unpack_from(cmd, 4)[0]
         self.assertEqual(nsid, 0)
 
         # Check DW10 (bytes 40-43): FID in bits 7:0, SV in bit 31
-        dw10 = struct.unpack('<L', cmd[40:44])[0]
+        dw10 = _DWORD.unpack_from(cmd, 40)[0]
         fid_extracted = dw10 & 0xFF
         sv_bit = (dw10 >> 31) & 1
         reserved_bits = (dw10 >> 8) & 0x7FFFFF  # Bits 30:8 should be 0
@@ -242,7 +266,7 @@ class TestAsyncEventCommands(unittest.TestCase):
         self.assertEqual(reserved_bits, 0, "Reserved bits 30:8 should be 0")
 
         # Check DW11 (bytes 44-47): Feature-specific value
-        dw11 = struct.unpack('<L', cmd[44:48])[0]
+        dw11 = _DWORD.unpack_from(cmd, 44)[0]
         self.assertEqual(dw11, value)
 
     def test_pack_set_features_command_with_save(self):
@@ -254,7 +278,7 @@ class TestAsyncEventCommands(unittest.TestCase):
         cmd = pack_set_features_command(cmd_id, feature_id, value, save=True)
 
         # Check DW10: SV bit should be 1
-        dw10 = struct.unpack('<L', cmd[40:44])[0]
+        dw10 = _DWORD.unpack_from(cmd, 40)[0]
         sv_bit = (dw10 >> 31) & 1
         self.assertEqual(sv_bit, 1, "Save bit should be 1")
 
@@ -271,24 +295,24 @@ class TestAsyncEventCommands(unittest.TestCase):
         self.assertEqual(opcode, NVMeOpcode.ASYNC_EVENT_REQUEST)
 
         # Check command ID (bytes 2-3)
-        parsed_cmd_id = struct.unpack('<H', cmd[2:4])[0]
+        parsed_cmd_id = _CID.unpack_from(cmd, 2)[0]
         self.assertEqual(parsed_cmd_id, cmd_id)
 
         # All other fields should be zero (reserved)
         # Check namespace ID (bytes 4-7) should be 0
-        nsid = struct.unpack('<L', cmd[4:8])[0]
+        nsid = _DWORD.unpack_from(cmd, 4)[0]
         self.assertEqual(nsid, 0)
 
         # Check DW10-15 are zero (bytes 40-63)
         for i in range(40, 64, 4):
-            dword = struct.unpack('<L', cmd[i: i + 4])[0]
+            dword = _DWORD.unpack_from(cmd, i)[0]
             self.assertEqual(dword, 0, f"Dword at offset {i} should be 0")
 
     def test_pack_async_event_request_different_ids(self):
         """Test packing with different command IDs."""
         for cmd_id in [1, 100, 1000, 65535]:
             cmd = pack_async_event_request_command(cmd_id)
-            parsed_cmd_id = struct.unpack('<H', cmd[2:4])[0]
+            parsed_cmd_id = _CID.unpack_from(cmd, 2)[0]
             self.assertEqual(parsed_cmd_id, cmd_id)
 
 
@@ -10,6 +10,12 @@ from nvmeof_client.parsers import ChangedNamespaceListParser
 class TestChangedNamespaceListParser(unittest.TestCase):
     """Test Changed Namespace List parsing."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Full 1024-entry log page, packed once in a single struct call
+        cls.max_nsids = list(range(1, 1025))
+        cls.max_data = struct.pack(f'<{len(cls.max_nsids)}L', *cls.max_nsids)
+
     def test_parse_empty_list(self):
         """Test parsing empty namespace list (all zeros)."""
         data = b'\x00' * 4096
@@ -27,7 +33,7 @@ class TestChangedNamespaceListParser(unittest.TestCase):
         """Test parsing list with multiple namespaces."""
         # NSIDs 1, 2, 5, 10 (in ascending order), followed by zeros
         nsids = [1, 2, 5, 10]
-        data = b''.join(struct.pack('<L', nsid) for nsid in nsids) + b'\x00' * (4096 - len(nsids) * 4)
+        data = struct.pack(f'<{len(nsids)}L', *nsids) + b'\x00' * (4096 - len(nsids) * 4)
         result = ChangedNamespaceListParser.parse_changed_namespace_list(data)
         self.assertEqual(result, nsids)
 
@@ -40,21 +46,17 @@ class TestChangedNamespaceListParser(unittest.TestCase):
 
     def test_parse_max_namespaces(self):
         """Test parsing maximum number of namespaces (1024)."""
-        # Create list of 1024 namespace IDs
-        nsids = list(range(1, 1025))
-        data = b''.join(struct.pack('<L', nsid) for nsid in nsids)
+        data = self.max_data
         self.assertEqual(len(data), 4096)  # Should be exactly 4096 bytes
 
         result = ChangedNamespaceListParser.parse_changed_namespace_list(data)
-        self.assertEqual(result, nsids)
+        self.assertEqual(result, self.max_nsids)
         self.assertEqual(len(result), 1024)
 
     def test_parse_terminated_by_zero(self):
         """Test that list is terminated by zero entry."""
         # NSIDs 1, 2, 3, then zero (end), followed by more data that should be ignored
-        data = (struct.pack('<L', 1) + struct.pack('<L', 2) +
-                struct.pack('<L', 3) + struct.pack('<L', 0) +
-                struct.pack('<L', 99) + struct.pack('<L', 100) + b'\x00' * (4096 - 24))
+        data = struct.pack('<6L', 1, 2, 3, 0, 99, 100) + b'\x00' * (4096 - 24)
         result = ChangedNamespaceListParser.parse_changed_namespace_list(data)
         # Should only get [1, 2, 3], stopping at zero
         self.assertEqual(result, [1, 2, 3])
@@ -62,7 +64,7 @@ class TestChangedNamespaceListParser(unittest.TestCase):
     def test_parse_short_data(self):
         """Test parsing data shorter than 4096 bytes."""
         # Only 3 entries
-        data = struct.pack('<L', 1) + struct.pack('<L', 5) + struct.pack('<L', 10)
+        data = struct.pack('<3L', 1, 5, 10)
         self.assertEqual(len(data), 12)
 
         result = ChangedNamespaceListParser.parse_changed_namespace_list(data)
@@ -85,6 +87,14 @@ class TestChangedNamespaceListParser(unittest.TestCase):
         result = ChangedNamespaceListParser.parse_changed_namespace_list(data)
         self.assertEqual(result, [])
 
+    def test_parse_as_tuple(self):
+        """Test as_tuple returns the same namespace IDs as a tuple."""
+        parse = ChangedNamespaceListParser.parse_changed_namespace_list
+        self.assertEqual(parse(self.max_data, as_tuple=True), tuple(self.max_nsids))
+        self.assertEqual(parse(struct.pack('<3L', 1, 5, 0), as_tuple=True), (1, 5))
+        self.assertEqual(parse(struct.pack('<L', 0xFFFFFFFF), as_tuple=True), (0xFFFFFFFF,))
+        self.assertEqual(parse(b'', as_tuple=True), ())
+
 
 class TestChangedNamespaceListFormatting(unittest.TestCase):
     """Test Changed Namespace List formatting."""
@@ -108,6 +118,8 @@ class TestChangedNamespaceListFormatting(unittest.TestCase):
         """Test formatting overflow indicator."""
         result = ChangedNamespaceListParser.format_changed_namespace_list([0xFFFFFFFF])
         self.assertEqual(result, "More than 1,024 namespaces changed (overflow)")
+        result = ChangedNamespaceListParser.format_changed_namespace_list((0xFFFFFFFF,))
+        self.assertEqual(result, "More than 1,024 namespaces changed (overflow)")
 
     def test_format_many_namespaces(self):
         """Test formatting truncates long lists."""
@@ -5,11 +5,14 @@ Tests the main client functionality including connection management,
 command sending, and error handling.
 """
 
+import io
 import socket
 import struct
+import threading
 import unittest
 from unittest.mock import (
     Mock,
+    call,
     patch,
 )
 from nvmeof_client.client import NVMeoFClient
@@ -17,6 +20,12 @@ from nvmeof_client.exceptions import (
     CommandError,
     NVMeoFConnectionError,
     NVMeoFTimeoutError,
+    ProtocolError,
+)
+from nvmeof_client.models import (
+    ANAGroupDescriptor,
+    ANALogPage,
+    ANAState,
 )
 from nvmeof_client.parsers.response import ResponseParser
 from nvmeof_client.protocol import (
@@ -74,7 +83,7 @@ class TestNVMeoFClient(unittest.TestCase):
         prop_get_vs_header = struct.pack('<BBBBI', PDUType.RSP, 0, 8, 8, 24)
         prop_get_vs_data = struct.pack('<LLHHHH', 0x010300, 0, 0, 0, 5, 0)  # Version 1.3
 
-        # Combine all responses into a single stream that recv will consume byte by byte
+        # Combine all responses into a single stream that recv will consume
         all_data = (
             icresp_header + icresp_data +
             connect_rsp_header + connect_rsp_data +
@@ -84,19 +93,8 @@ class TestNVMeoFClient(unittest.TestCase):
             prop_get_vs_header + prop_get_vs_data
         )
 
-        data_position = [0]
-
-        def mock_recv(size):
-            if data_position[0] < len(all_data):
-                # Return up to 'size' bytes from current position
-                start = data_position[0]
-                end = min(start + size, len(all_data))
-                chunk = all_data[start:end]
-                data_position[0] = end
-                return chunk
-            return b''  # No more data
-
-        mock_socket.recv.side_effect = mock_recv
+        # BytesIO.read returns up to 'size' bytes per call and b'' once the stream is exhausted
+        mock_socket.recv.side_effect = io.BytesIO(all_data).read
 
         self.client.connect()
 
@@ -111,9 +109,10 @@ class TestNVMeoFClient(unittest.TestCase):
         mock_socket_class.return_value = mock_socket
         mock_socket.connect.side_effect = socket.timeout()
 
-        with self.assertRaises(NVMeoFTimeoutError):
+        with self.assertRaises(NVMeoFTimeoutError) as cm:
             self.client.connect()
 
+        self.assertIsInstance(cm.exception.__cause__, socket.timeout)
         self.assertFalse(self.client.is_connected)
         mock_socket.close.assert_called_once()
 
@@ -124,10 +123,25 @@ class TestNVMeoFClient(unittest.TestCase):
         mock_socket_class.return_value = mock_socket
         mock_socket.connect.side_effect = socket.error("Connection refused")
 
+        with self.assertRaises(NVMeoFConnectionError) as cm:
+            self.client.connect()
+
+        self.assertIsInstance(cm.exception.__cause__, OSError)
+
+        self.assertFalse(self.client.is_connected)
+
+    @patch('socket.socket')
+    def test_connect_failure_after_initialization(self, mock_socket_class):
+        """Test is_connected is reset when connect() fails after the connection was initialized."""
+        mock_socket_class.return_value = Mock()
+        self.client._initialize_connection = Mock()
+        self.client.configure_controller = Mock(side_effect=ProtocolError("Controller not ready"))
+
         with self.assertRaises(NVMeoFConnectionError):
             self.client.connect()
 
         self.assertFalse(self.client.is_connected)
+        self.assertIsNone(self.client._socket)
 
     def test_connect_already_connected(self):
         """Test connecting when already connected."""
@@ -190,6 +204,27 @@ class TestNVMeoFClient(unittest.TestCase):
         self.assertEqual(result['status'], 0)
         mock_socket.sendall.assert_called()
 
+    def test_send_command_with_data_single_sendall(self):
+        """Test command data is sent as an in-capsule Command PDU with one sendall()."""
+        mock_socket = Mock()
+        self.client._socket = mock_socket
+        self.client._connected = True
+
+        response_header = struct.pack('<BBBBI', PDUType.RSP, 0, 8, 8, 24)
+        response_data = struct.pack('<LLHHHH', 0, 0, 0, 0, 1, 0)
+        mock_socket.recv.side_effect = [response_header, response_data]
+
+        self.client.send_command(NVMeOpcode.IDENTIFY, data=b'\xAB' * 16)
+
+        mock_socket.sendall.assert_called_once()
+        sent = mock_socket.sendall.call_args[0][0]
+        # HLEN/PDO 72 (CH + SQE), PLEN covers the data
+        self.assertEqual(sent[:8], struct.pack('<BBBBI', PDUType.CMD, 0, 72, 72, 72 + 16))
+        # SGL data transfer flag and in-capsule Data Block with Offset descriptor
+        self.assertEqual(sent[9], 0x40)
+        self.assertEqual(struct.unpack_from('<L3xB', sent, 8 + 32), (16, 0x01))
+        self.assertEqual(sent[72:], b'\xAB' * 16)
+
     def test_send_command_not_connected(self):
         """Test sending command when not connected."""
         with self.assertRaises(NVMeoFConnectionError):
@@ -224,6 +259,26 @@ class TestNVMeoFClient(unittest.TestCase):
         with self.assertRaises(NVMeoFTimeoutError):
             self.client.send_command(NVMeOpcode.IDENTIFY, timeout=1.0)
 
+    def test_send_command_timeout_reconfigured_only_on_change(self):
+        """Test socket timeout is only touched when a command overrides it."""
+        mock_socket = Mock()
+        mock_socket.gettimeout.return_value = self.client.timeout
+        self.client._socket = mock_socket
+        self.client._connected = True
+
+        response_header = struct.pack('<BBBBI', PDUType.RSP, 0, 8, 8, 24)
+        mock_socket.recv.side_effect = [
+            response_header, struct.pack('<LLHHHH', 0, 0, 0, 0, 1, 0),
+            response_header, struct.pack('<LLHHHH', 0, 0, 0, 0, 2, 0),
+        ]
+
+        self.client.send_command(NVMeOpcode.IDENTIFY)
+        mock_socket.settimeout.assert_not_called()
+
+        self.client.send_command(NVMeOpcode.IDENTIFY, timeout=self.client.timeout + 1)
+        self.assertEqual(mock_socket.settimeout.call_args_list,
+                         [call(self.client.timeout + 1), call(self.client.timeout)])
+
     @patch('socket.socket')
     def test_identify_controller(self, mock_socket_class):
         """Test identify controller method."""
@@ -240,6 +295,132 @@ class TestNVMeoFClient(unittest.TestCase):
             # Will fail because we're not actually connected, but proves method exists
             self.client.identify_controller()
 
+    def test_get_ana_state_from_log_page(self):
+        """Test get_ana_state() derives states from a provided log page without refetching."""
+        ana_log = ANALogPage(
+            change_count=1,
+            num_ana_group_descriptors=2,
+            groups=[
+                ANAGroupDescriptor(1, 1, 0, ANAState.OPTIMIZED, [1]),
+                ANAGroupDescriptor(2, 1, 0, ANAState.INACCESSIBLE, [2]),
+            ]
+        )
+        self.client.get_ana_log_page = Mock()
+
+        states = self.client.get_ana_state(ana_log=ana_log)
+
+        self.assertEqual(states, {1: ANAState.OPTIMIZED, 2: ANAState.INACCESSIBLE})
+        self.client.get_ana_log_page.assert_not_called()
+
+    def _setup_batch_write_client(self, completions, events):
+        """Prepare a connected client whose I/O socket replays write completions."""
+        self.client._connected = True
+        self.client._io_queues_setup = True
+        self.client._ioccsz = 260  # 4160-byte capsules, 4096 bytes of inline data
+        self.client._namespace_info_cache[1] = {'logical_block_size': 512}
+        self.client._io_queue_size = 3  # Two commands outstanding at most
+        self.client._io_socket = Mock()
+        self.client._io_socket.sendall.side_effect = lambda data: events.append('send')
+
+        responses = iter(completions)
+
+        def receive(sock):
+            events.append('recv')
+            command_id, status = next(responses)
+            return Mock(pdu_type=PDUType.RSP), struct.pack('<LLHHHH', 0, 0, 0, 0, command_id, status)
+
+        self.client._receive_pdu_on_socket = Mock(side_effect=receive)
+
+    def test_write_data_batch_pipelines_writes(self):
+        """Test write_data_batch() submits a queue-depth window before collecting completions."""
+        events = []
+        # Completions of the first window arrive out of order
+        self._setup_batch_write_client([(2, 0), (1, 0), (3, 0)], events)
+
+        self.client.write_data_batch(1, [(0, b'\x01' * 512), (1, b'\x02' * 512), (8, b'\x03' * 1024)])
+
+        self.assertEqual(events, ['send', 'send', 'recv', 'recv', 'send', 'recv'])
+
+    def test_write_data_batch_drains_window_on_error(self):
+        """Test write_data_batch() receives the whole window before raising a failed write."""
+        events = []
+        self._setup_batch_write_client([(1, 0x0002), (2, 0)], events)
+
+        with self.assertRaises(CommandError):
+            self.client.write_data_batch(1, [(0, b'\x01' * 512), (1, b'\x02' * 512)])
+
+        self.assertEqual(self.client._receive_pdu_on_socket.call_count, 2)
+
+    def test_write_data_batch_rejects_short_completion(self):
+        """Test write_data_batch() reports a truncated completion as a parse error."""
+        self._setup_batch_write_client([], [])
+        self.client._receive_pdu_on_socket = Mock(return_value=(Mock(pdu_type=PDUType.RSP), b'\x00' * 8))
+
+        with self.assertRaises(ValueError):
+            self.client.write_data_batch(1, [(0, b'\x01' * 512)])
+
+    def test_write_data_batch_keeps_order_around_r2t_write(self):
+        """Test write_data_batch() completes pending inline writes before an R2T write."""
+        events = []
+        self._setup_batch_write_client([(1, 0), (2, 0)], events)
+        self.client.write_data = Mock(side_effect=lambda nsid, lba, data: events.append('write_data'))
+
+        self.client.write_data_batch(1, [(0, b'\x01' * 512), (1, b'\x02' * 8192), (2, b'\x03' * 512)])
+
+        self.assertEqual(events, ['send', 'recv', 'write_data', 'send', 'recv'])
+
+    def test_write_data_batch_serializes_overlapping_writes(self):
+        """Test write_data_batch() does not keep overlapping writes outstanding together."""
+        events = []
+        self._setup_batch_write_client([(1, 0), (2, 0)], events)
+
+        # LBA 1 is written by both commands
+        self.client.write_data_batch(1, [(0, b'\x01' * 1024), (1, b'\x02' * 512)])
+
+        self.assertEqual(events, ['send', 'recv', 'send', 'recv'])
+
+    def test_io_pipeline_depth_limits(self):
+        """Test the pipelining window is capped by the I/O SQ size and MAXCMD."""
+        self.client._io_queue_size = 128
+        self.assertEqual(self.client._get_io_pipeline_depth(), 127)
+
+        self.client._maxcmd = 16
+        self.assertEqual(self.client._get_io_pipeline_depth(), 16)
+
+    def test_io_commands_hold_io_lock(self):
+        """Test I/O queue commands run with the client's I/O lock held."""
+        self.client._connected = True
+        self.client._io_queues_setup = True
+        lock_available = []
+
+        def probe_lock(nsid):
+            # Another thread must not be able to take the lock while the command runs
+            thread = threading.Thread(
+                target=lambda: lock_available.append(self.client._io_lock.acquire(blocking=False)))
+            thread.start()
+            thread.join()
+            return 512
+
+        self.client._get_namespace_logical_block_size = Mock(side_effect=probe_lock)
+
+        # IOCCSZ was never negotiated, so the write stops after the block size lookup
+        with self.assertRaises(ProtocolError):
+            self.client.write_data(1, 0, b'\x00' * 512)
+
+        self.assertEqual(lock_available, [False])
+
+    def test_recv_exactly_short_reads(self):
+        """Test that receiving reassembles data returned in several short reads."""
+        mock_socket = Mock()
+        mock_socket.recv.side_effect = [b'ab', b'cde', b'f']
+
+        self.assertEqual(self.client._recv_exactly(mock_socket, 6), b'abcdef')
+        self.assertEqual(mock_socket.recv.call_count, 3)
+
+        mock_socket.recv.side_effect = [b'ab', b'']
+        with self.assertRaises(NVMeoFConnectionError):
+            self.client._recv_exactly(mock_socket, 6)
+
     def test_get_next_command_id(self):
         """Test command ID generation."""
         id1 = self.client._get_next_command_id()
@@ -288,7 +469,7 @@ class TestNVMeoFClient(unittest.TestCase):
         prop_get_vs_header = struct.pack('<BBBBI', PDUType.RSP, 0, 8, 8, 24)
         prop_get_vs_data = struct.pack('<LLHHHH', 0x010300, 0, 0, 0, 5, 0)  # Version 1.3
 
-        # Combine all responses into a single stream that recv will consume byte by byte
+        # Combine all responses into a single stream that recv will consume
         all_data = (
             icresp_header + icresp_data +
             connect_rsp_header + connect_rsp_data +
@@ -298,19 +479,8 @@ class TestNVMeoFClient(unittest.TestCase):
             prop_get_vs_header + prop_get_vs_data
         )
 
-        data_position = [0]
-
-        def mock_recv(size):
-            if data_position[0] < len(all_data):
-                # Return up to 'size' bytes from current position
-                start = data_position[0]
-                end = min(start + size, len(all_data))
-                chunk = all_data[start:end]
-                data_position[0] = end
-                return chunk
-            return b''  # No more data
-
-        mock_socket.recv.side_effect = mock_recv
+        # BytesIO.read returns up to 'size' bytes per call and b'' once the stream is exhausted
+        mock_socket.recv.side_effect = io.BytesIO(all_data).read
 
         with self.client:
             self.assertTrue(self.client.is_connected)
@@ -4,6 +4,7 @@ Unit tests for exception classes
 Tests custom exception hierarchy and error information.
 """
 
+import pickle
 import unittest
 
 from nvmeof_client.exceptions import (
@@ -78,6 +79,14 @@ class TestCommandError(unittest.TestCase):
         self.assertEqual(exc.status_code, 0x05)
         self.assertEqual(exc.command_id, 456)
 
+    def test_command_error_pickle_roundtrip(self):
+        """Test CommandError attributes survive pickling."""
+        exc = pickle.loads(pickle.dumps(CommandError("Command failed", status_code=0x02, command_id=7)))
+        self.assertEqual(str(exc), "Command failed")
+        self.assertEqual(exc.status_code, 0x02)
+        self.assertEqual(exc.command_id, 7)
+        self.assertIsNotNone(exc.status_description)
+
 
 class TestExceptionRaising(unittest.TestCase):
     """Test exception raising and catching."""
@@ -22,47 +22,117 @@ from nvmeof_client.models import (
 )
 
 
+# Shared constructor arguments; tests override individual fields as needed
+_BASE_CONTROLLER_KWARGS = {
+    'vendor_id': 0x1234,
+    'subsystem_vendor_id': 0x5678,
+    'serial_number': "TEST123456789",
+    'model_number': "Test NVMe Controller",
+    'firmware_revision': "1.0.0",
+    'controller_id': 1,
+    'max_data_transfer_size': 131072,
+    'controller_multipath_io_capabilities': 0,
+    'optional_admin_command_support': 0x1FF,
+    'optional_nvm_command_support': 0x3F,
+    'oaes_namespace_attribute_notices': True,
+    'oaes_firmware_activation_notices': True,
+    'oaes_ana_change_notices': True,
+    'oaes_predictable_latency_event_notices': False,
+    'oaes_lba_status_information_notices': False,
+    'oaes_endurance_group_event_notices': False,
+    'oaes_normal_subsystem_shutdown_notices': False,
+    'oaes_temperature_threshold_hysteresis': False,
+    'oaes_reachability_groups_change_notices': False,
+    'oaes_allocated_namespace_attribute_notices': False,
+    'oaes_cross_controller_reset_notices': False,
+    'oaes_lost_host_communication_notices': False,
+    'oaes_zone_descriptor_changed_notices': False,
+    'oaes_discovery_log_change_notices': False,
+    'aerl': 3,
+    'max_submission_queue_entries': 64,
+    'max_completion_queue_entries': 64,
+    'number_of_namespaces': 256,
+    'max_power_consumption': 25,
+    'warning_composite_temp_threshold': 70,
+    'critical_composite_temp_threshold': 85,
+}
+
+_BASE_CAPS_KWARGS = {
+    'max_queue_entries_supported': 1024,
+    'contiguous_queues_required': False,
+    'arbitration_mechanism_supported': 0x3,
+    'timeout': 15000,
+    'doorbell_stride': 4,
+    'nvm_subsystem_reset_supported': True,
+    'command_sets_supported': 0x41,
+    'boot_partition_support': False,
+    'memory_page_size_minimum': 4096,
+    'memory_page_size_maximum': 65536,
+}
+
+# (member, expected value) pairs checked by TestEnums
+_TRANSPORT_TYPE_VALUES = (
+    (TransportType.RDMA, 1),
+    (TransportType.FC, 2),
+    (TransportType.TCP, 3),
+    (TransportType.LOOP, 4),
+)
+
+_ADDRESS_FAMILY_VALUES = (
+    (AddressFamily.IPV4, 1),
+    (AddressFamily.IPV6, 2),
+    (AddressFamily.FC, 3),
+    (AddressFamily.IB, 4),
+)
+
+# Values match the NVMe spec reservation types
+_RESERVATION_TYPE_VALUES = (
+    (ReservationType.WRITE_EXCLUSIVE, 1),
+    (ReservationType.EXCLUSIVE_ACCESS, 2),
+    (ReservationType.WRITE_EXCLUSIVE_REGISTRANTS_ONLY, 3),
+    (ReservationType.EXCLUSIVE_ACCESS_REGISTRANTS_ONLY, 4),
+    (ReservationType.WRITE_EXCLUSIVE_ALL_REGISTRANTS, 5),
+    (ReservationType.EXCLUSIVE_ACCESS_ALL_REGISTRANTS, 6),
+)
+
+_RESERVATION_ACTION_VALUES = (
+    # Register actions
+    (ReservationAction.REGISTER, 0),
+    (ReservationAction.UNREGISTER, 1),
+    (ReservationAction.REPLACE, 2),
+    # Acquire actions (same values, different context)
+    (ReservationAction.ACQUIRE, 0),
+    (ReservationAction.PREEMPT, 1),
+    (ReservationAction.PREEMPT_AND_ABORT, 2),
+    # Release actions
+    (ReservationAction.RELEASE, 0),
+    (ReservationAction.CLEAR, 1),
+)
+
+
 class TestEnums(unittest.TestCase):
     """Test enum definitions and values."""
 
+    def _assert_enum_values(self, expected_values):
+        for member, expected in expected_values:
+            with self.subTest(member=member):
+                self.assertEqual(member.value, expected)
+
     def test_transport_type_enum(self):
         """Test TransportType enum values."""
-        self.assertEqual(TransportType.RDMA.value, 1)
-        self.assertEqual(TransportType.FC.value, 2)
-        self.assertEqual(TransportType.TCP.value, 3)
-        self.assertEqual(TransportType.LOOP.value, 4)
+        self._assert_enum_values(_TRANSPORT_TYPE_VALUES)
 
     def test_address_family_enum(self):
         """Test AddressFamily enum values."""
-        self.assertEqual(AddressFamily.IPV4.value, 1)
-        self.assertEqual(AddressFamily.IPV6.value, 2)
-        self.assertEqual(AddressFamily.FC.value, 3)
-        self.assertEqual(AddressFamily.IB.value, 4)
+        self._assert_enum_values(_ADDRESS_FAMILY_VALUES)
 
     def test_reservation_type_enum(self):
         """Test ReservationType enum values match NVMe spec."""
-        self.assertEqual(ReservationType.WRITE_EXCLUSIVE.value, 1)
-        self.assertEqual(ReservationType.EXCLUSIVE_ACCESS.value, 2)
-        self.assertEqual(ReservationType.WRITE_EXCLUSIVE_REGISTRANTS_ONLY.value, 3)
-        self.assertEqual(ReservationType.EXCLUSIVE_ACCESS_REGISTRANTS_ONLY.value, 4)
-        self.assertEqual(ReservationType.WRITE_EXCLUSIVE_ALL_REGISTRANTS.value, 5)
-        self.assertEqual(ReservationType.EXCLUSIVE_ACCESS_ALL_REGISTRANTS.value, 6)
+        self._assert_enum_values(_RESERVATION_TYPE_VALUES)
 
     def test_reservation_action_enum(self):
         """Test ReservationAction enum values."""
-        # Register actions
-        self.assertEqual(ReservationAction.REGISTER.value, 0)
-        self.assertEqual(ReservationAction.UNREGISTER.value, 1)
-        self.assertEqual(ReservationAction.REPLACE.value, 2)
-
-        # Acquire actions (same values, different context)
-        self.assertEqual(ReservationAction.ACQUIRE.value, 0)
-        self.assertEqual(ReservationAction.PREEMPT.value, 1)
-        self.assertEqual(ReservationAction.PREEMPT_AND_ABORT.value, 2)
-
-        # Release actions
-        self.assertEqual(ReservationAction.RELEASE.value, 0)
-        self.assertEqual(ReservationAction.CLEAR.value, 1)
+        self._assert_enum_values(_RESERVATION_ACTION_VALUES)
 
 
 class TestControllerInfo(unittest.TestCase):
@@ -70,39 +140,7 @@ class TestControllerInfo(unittest.TestCase):
 
     def test_controller_info_creation(self):
         """Test ControllerInfo model creation."""
-        info = ControllerInfo(
-            vendor_id=0x1234,
-            subsystem_vendor_id=0x5678,
-            serial_number="TEST123456789",
-            model_number="Test NVMe Controller",
-            firmware_revision="1.0.0",
-            controller_id=1,
-            max_data_transfer_size=131072,
-            controller_multipath_io_capabilities=0,
-            optional_admin_command_support=0x1FF,
-            optional_nvm_command_support=0x3F,
-            oaes_namespace_attribute_notices=True,
-            oaes_firmware_activation_notices=True,
-            oaes_ana_change_notices=True,
-            oaes_predictable_latency_event_notices=False,
-            oaes_lba_status_information_notices=False,
-            oaes_endurance_group_event_notices=False,
-            oaes_normal_subsystem_shutdown_notices=False,
-            oaes_temperature_threshold_hysteresis=False,
-            oaes_reachability_groups_change_notices=False,
-            oaes_allocated_namespace_attribute_notices=False,
-            oaes_cross_controller_reset_notices=False,
-            oaes_lost_host_communication_notices=False,
-            oaes_zone_descriptor_changed_notices=False,
-            oaes_discovery_log_change_notices=False,
-            aerl=3,
-            max_submission_queue_entries=64,
-            max_completion_queue_entries=64,
-            number_of_namespaces=256,
-            max_power_consumption=25,
-            warning_composite_temp_threshold=70,
-            critical_composite_temp_threshold=85
-        )
+        info = ControllerInfo(**_BASE_CONTROLLER_KWARGS)
 
         self.assertEqual(info.vendor_id, 0x1234)
         self.assertEqual(info.serial_number, "TEST123456789")
@@ -115,42 +153,17 @@ class TestControllerInfo(unittest.TestCase):
 
     def test_controller_info_optional_fields(self):
         """Test ControllerInfo with optional fields."""
-        info = ControllerInfo(
-            vendor_id=0x1234,
-            subsystem_vendor_id=0x5678,
-            serial_number="TEST123456789",
-            model_number="Test NVMe Controller",
-            firmware_revision="1.0.0",
-            controller_id=1,
-            max_data_transfer_size=131072,
-            controller_multipath_io_capabilities=0,
-            optional_admin_command_support=0x1FF,
-            optional_nvm_command_support=0x3F,
-            oaes_namespace_attribute_notices=False,
-            oaes_firmware_activation_notices=True,
-            oaes_ana_change_notices=False,
-            oaes_predictable_latency_event_notices=False,
-            oaes_lba_status_information_notices=False,
-            oaes_endurance_group_event_notices=False,
-            oaes_normal_subsystem_shutdown_notices=True,
-            oaes_temperature_threshold_hysteresis=False,
-            oaes_reachability_groups_change_notices=False,
-            oaes_allocated_namespace_attribute_notices=False,
-            oaes_cross_controller_reset_notices=False,
-            oaes_lost_host_communication_notices=False,
-            oaes_zone_descriptor_changed_notices=False,
-            oaes_discovery_log_change_notices=True,
-            aerl=2,
-            max_submission_queue_entries=64,
-            max_completion_queue_entries=64,
-            number_of_namespaces=256,
-            max_power_consumption=25,
-            warning_composite_temp_threshold=70,
-            critical_composite_temp_threshold=85,
-            nvmeof_attributes=0x01,
-            nvme_version="1.4",
-            raw_data=b'raw_controller_data'
-        )
+        info = ControllerInfo(**{
+            **_BASE_CONTROLLER_KWARGS,
+            'oaes_namespace_attribute_notices': False,
+            'oaes_ana_change_notices': False,
+            'oaes_normal_subsystem_shutdown_notices': True,
+            'oaes_discovery_log_change_notices': True,
+            'aerl': 2,
+            'nvmeof_attributes': 0x01,
+            'nvme_version': "1.4",
+            'raw_data': b'raw_controller_data',
+        })
 
         self.assertEqual(info.nvmeof_attributes, 0x01)
         self.assertEqual(info.nvme_version, "1.4")
@@ -190,9 +203,20 @@ class TestNamespaceInfo(unittest.TestCase):
 class TestDiscoveryEntry(unittest.TestCase):
     """Test DiscoveryEntry data model."""
 
-    def test_discovery_entry_creation(self):
-        """Test DiscoveryEntry model creation."""
-        entry = DiscoveryEntry(
+    @classmethod
+    def setUpClass(cls):
+        # Entries are only read by the tests, so one pair serves the whole class
+        cls.discovery_entry = DiscoveryEntry(
+            transport_type=TransportType.TCP,
+            address_family=AddressFamily.IPV4,
+            subsystem_type=1,  # Discovery
+            port_id=1,
+            controller_id=1,
+            transport_address="192.168.1.100",
+            transport_service_id="4420",
+            subsystem_nqn="nqn.2014-08.org.nvmexpress.discovery"
+        )
+        cls.nvme_entry = DiscoveryEntry(
             transport_type=TransportType.TCP,
             address_family=AddressFamily.IPV4,
             subsystem_type=2,  # NVMe subsystem
@@ -203,6 +227,10 @@ class TestDiscoveryEntry(unittest.TestCase):
             subsystem_nqn="nqn.2019-05.io.spdk:target"
         )
 
+    def test_discovery_entry_creation(self):
+        """Test DiscoveryEntry model creation."""
+        entry = self.nvme_entry
+
         self.assertEqual(entry.transport_type, TransportType.TCP)
         self.assertEqual(entry.address_family, AddressFamily.IPV4)
         self.assertEqual(entry.subsystem_type, 2)
@@ -212,34 +240,12 @@ class TestDiscoveryEntry(unittest.TestCase):
     def test_discovery_entry_properties(self):
         """Test DiscoveryEntry property methods."""
         # Discovery subsystem
-        discovery_entry = DiscoveryEntry(
-            transport_type=TransportType.TCP,
-            address_family=AddressFamily.IPV4,
-            subsystem_type=1,  # Discovery
-            port_id=1,
-            controller_id=1,
-            transport_address="192.168.1.100",
-            transport_service_id="4420",
-            subsystem_nqn="nqn.2014-08.org.nvmexpress.discovery"
-        )
-
-        self.assertTrue(discovery_entry.is_discovery_subsystem)
-        self.assertFalse(discovery_entry.is_nvme_subsystem)
+        self.assertTrue(self.discovery_entry.is_discovery_subsystem)
+        self.assertFalse(self.discovery_entry.is_nvme_subsystem)
 
         # NVMe subsystem
-        nvme_entry = DiscoveryEntry(
-            transport_type=TransportType.TCP,
-            address_family=AddressFamily.IPV4,
-            subsystem_type=2,  # NVMe
-            port_id=1,
-            controller_id=1,
-            transport_address="192.168.1.100",
-            transport_service_id="4420",
-            subsystem_nqn="nqn.2019-05.io.spdk:target"
-        )
-
-        self.assertFalse(nvme_entry.is_discovery_subsystem)
-        self.assertTrue(nvme_entry.is_nvme_subsystem)
+        self.assertFalse(self.nvme_entry.is_discovery_subsystem)
+        self.assertTrue(self.nvme_entry.is_nvme_subsystem)
 
 
 class TestControllerCapabilities(unittest.TestCase):
@@ -247,18 +253,7 @@ class TestControllerCapabilities(unittest.TestCase):
 
     def test_controller_capabilities_creation(self):
         """Test ControllerCapabilities model creation."""
-        caps = ControllerCapabilities(
-            max_queue_entries_supported=1024,
-            contiguous_queues_required=False,
-            arbitration_mechanism_supported=0x3,
-            timeout=15000,
-            doorbell_stride=4,
-            nvm_subsystem_reset_supported=True,
-            command_sets_supported=0x41,
-            boot_partition_support=False,
-            memory_page_size_minimum=4096,
-            memory_page_size_maximum=65536
-        )
+        caps = ControllerCapabilities(**_BASE_CAPS_KWARGS)
 
         self.assertEqual(caps.max_queue_entries_supported, 1024)
         self.assertFalse(caps.contiguous_queues_required)
@@ -273,18 +268,16 @@ class TestControllerCapabilities(unittest.TestCase):
 
     def test_controller_capabilities_minimum_values(self):
         """Test ControllerCapabilities with minimum valid values."""
-        caps = ControllerCapabilities(
-            max_queue_entries_supported=2,
-            contiguous_queues_required=True,
-            arbitration_mechanism_supported=0,
-            timeout=500,
-            doorbell_stride=4,
-            nvm_subsystem_reset_supported=False,
-            command_sets_supported=0x01,
-            boot_partition_support=False,
-            memory_page_size_minimum=4096,
-            memory_page_size_maximum=4096
-        )
+        caps = ControllerCapabilities(**{
+            **_BASE_CAPS_KWARGS,
+            'max_queue_entries_supported': 2,
+            'contiguous_queues_required': True,
+            'arbitration_mechanism_supported': 0,
+            'timeout': 500,
+            'nvm_subsystem_reset_supported': False,
+            'command_sets_supported': 0x01,
+            'memory_page_size_maximum': 4096,
+        })
 
         self.assertEqual(caps.max_queue_entries_supported, 2)
         self.assertTrue(caps.contiguous_queues_required)
@@ -292,18 +285,15 @@ class TestControllerCapabilities(unittest.TestCase):
 
     def test_controller_capabilities_maximum_values(self):
         """Test ControllerCapabilities with maximum typical values."""
-        caps = ControllerCapabilities(
-            max_queue_entries_supported=65536,
-            contiguous_queues_required=False,
-            arbitration_mechanism_supported=0x3,
-            timeout=255000,
-            doorbell_stride=256,
-            nvm_subsystem_reset_supported=True,
-            command_sets_supported=0xFF,
-            boot_partition_support=True,
-            memory_page_size_minimum=4096,
-            memory_page_size_maximum=16777216
-        )
+        caps = ControllerCapabilities(**{
+            **_BASE_CAPS_KWARGS,
+            'max_queue_entries_supported': 65536,
+            'timeout': 255000,
+            'doorbell_stride': 256,
+            'command_sets_supported': 0xFF,
+            'boot_partition_support': True,
+            'memory_page_size_maximum': 16777216,
+        })
 
         self.assertEqual(caps.max_queue_entries_supported, 65536)
         self.assertEqual(caps.timeout, 255000)
@@ -355,9 +345,10 @@ class TestControllerStatus(unittest.TestCase):
 class TestReservationStatus(unittest.TestCase):
     """Test ReservationStatus data model."""
 
-    def test_reservation_status_reserved(self):
-        """Test ReservationStatus when namespace is reserved."""
-        status = ReservationStatus(
+    @classmethod
+    def setUpClass(cls):
+        # Read-only reserved status shared by the tests of this class
+        cls.reserved = ReservationStatus(
             generation=123,
             reservation_type=ReservationType.WRITE_EXCLUSIVE,
             reservation_holder=42,  # Non-zero = reserved
@@ -365,6 +356,10 @@ class TestReservationStatus(unittest.TestCase):
             reservation_keys={1: 0x1111, 2: 0x2222, 42: 0x4242}
         )
 
+    def test_reservation_status_reserved(self):
+        """Test ReservationStatus when namespace is reserved."""
+        status = self.reserved
+
         self.assertEqual(status.generation, 123)
         self.assertEqual(status.reservation_type, ReservationType.WRITE_EXCLUSIVE)
         self.assertEqual(status.reservation_holder, 42)
@@ -418,6 +413,7 @@ class TestReservationInfo(unittest.TestCase):
         self.assertEqual(info.generation, 789)
         self.assertEqual(info.status_code, 0)
         self.assertIsNone(info.reservation_status)  # Not provided
+        self.assertIsNone(info.controller_id)  # Not provided
 
     def test_reservation_info_with_status(self):
         """Test ReservationInfo with detailed reservation status."""
@@ -454,6 +450,21 @@ class TestReservationInfo(unittest.TestCase):
         self.assertFalse(info.success)
         self.assertEqual(info.status_code, 0x18)
 
+    def test_reservation_info_positional_order(self):
+        """Test reservation_status stays the fifth positional field."""
+        detailed_status = ReservationStatus(
+            generation=1,
+            reservation_type=ReservationType.WRITE_EXCLUSIVE,
+            reservation_holder=1,
+            registered_controllers=[1],
+            reservation_keys={1: 0x1234}
+        )
+
+        info = ReservationInfo(True, 0x1234, 1, 0, detailed_status)
+
+        self.assertIs(info.reservation_status, detailed_status)
+        self.assertIsNone(info.controller_id)
+
 
 class TestConnectionInfo(unittest.TestCase):
     """Test ConnectionInfo data model."""
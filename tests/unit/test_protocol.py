@@ -15,31 +15,54 @@ from nvmeof_client.protocol import (
     PDUHeader,
     parse_controller_capabilities,
     parse_discovery_log_page,
-    format_discovery_entry
+    format_discovery_entry,
+    pack_nvme_data_command
 )
 from nvmeof_client.protocol.utils import pack_nvme_command
 
+# Wire layouts used to build and check test data
+_PDU_HEADER_STRUCT = struct.Struct('<BBBBI')        # Common header: type, flags, HLEN, PDO, PLEN
+_COMMAND_HEAD_STRUCT = struct.Struct('<BBHI')       # Command dword 0 and NSID
+_CAP_STRUCT = struct.Struct('<Q')                   # CAP register
+_DISCOVERY_HEADER_STRUCT = struct.Struct('<QQ')     # Discovery log: generation, number of records
+
+# Zero fill after the discovery log header up to a 1024-byte page (immutable, shared by tests)
+_DISCOVERY_ZERO_PAD = bytes(1024 - _DISCOVERY_HEADER_STRUCT.size)
+
+# (constant, expected value) pairs checked by TestProtocolConstants
+_PDU_TYPE_VALUES = (
+    (PDUType.ICREQ, 0x00),
+    (PDUType.ICRESP, 0x01),
+    (PDUType.CMD, 0x04),
+    (PDUType.RSP, 0x05),
+    (PDUType.H2C_DATA, 0x06),
+    (PDUType.R2T, 0x09),
+)
+
+_NVME_OPCODE_VALUES = (
+    (NVMeOpcode.IDENTIFY, 0x06),
+    (NVMeOpcode.CREATE_IO_SQ, 0x01),
+    (NVMeOpcode.CREATE_IO_CQ, 0x05),
+    (NVMeOpcode.READ, 0x02),
+    (NVMeOpcode.WRITE, 0x01),
+    (NVMeOpcode.FLUSH, 0x00),
+)
+
 
 class TestProtocolConstants(unittest.TestCase):
     """Test protocol constants and enums."""
 
     def test_pdu_types(self):
         """Test PDU type constants."""
-        self.assertEqual(PDUType.ICREQ, 0x00)
-        self.assertEqual(PDUType.ICRESP, 0x01)
-        self.assertEqual(PDUType.CMD, 0x04)
-        self.assertEqual(PDUType.RSP, 0x05)
-        self.assertEqual(PDUType.H2C_DATA, 0x06)
-        self.assertEqual(PDUType.R2T, 0x09)
+        for constant, expected in _PDU_TYPE_VALUES:
+            with self.subTest(constant=constant):
+                self.assertEqual(constant, expected)
 
     def test_nvme_opcodes(self):
         """Test NVMe opcode constants."""
-        self.assertEqual(NVMeOpcode.IDENTIFY, 0x06)
-        self.assertEqual(NVMeOpcode.CREATE_IO_SQ, 0x01)
-        self.assertEqual(NVMeOpcode.CREATE_IO_CQ, 0x05)
-        self.assertEqual(NVMeOpcode.READ, 0x02)
-        self.assertEqual(NVMeOpcode.WRITE, 0x01)
-        self.assertEqual(NVMeOpcode.FLUSH, 0x00)
+        for constant, expected in _NVME_OPCODE_VALUES:
+            with self.subTest(constant=constant):
+                self.assertEqual(constant, expected)
 
 
 class TestPDUHeader(unittest.TestCase):
@@ -48,12 +71,12 @@ class TestPDUHeader(unittest.TestCase):
     def test_pack_pdu_header(self):
         """Test PDU header packing."""
         header = pack_pdu_header(PDUType.CMD, 0x01, 8, 8, 72)
-        expected = struct.pack('<BBBBI', PDUType.CMD, 0x01, 8, 8, 72)
+        expected = _PDU_HEADER_STRUCT.pack(PDUType.CMD, 0x01, 8, 8, 72)
         self.assertEqual(header, expected)
 
     def test_unpack_pdu_header(self):
         """Test PDU header unpacking."""
-        data = struct.pack('<BBBBI', PDUType.RSP, 0x02, 8, 8, 24)
+        data = _PDU_HEADER_STRUCT.pack(PDUType.RSP, 0x02, 8, 8, 24)
         header = unpack_pdu_header(data)
 
         self.assertEqual(header.pdu_type, PDUType.RSP)
@@ -88,7 +111,7 @@ class TestNVMeCommand(unittest.TestCase):
         self.assertEqual(len(cmd), 64)  # NVMe command is 64 bytes
 
         # Check first few fields
-        opcode, flags, command_id, nsid = struct.unpack('<BBHI', cmd[:8])
+        opcode, flags, command_id, nsid = _COMMAND_HEAD_STRUCT.unpack_from(cmd)
         self.assertEqual(opcode, NVMeOpcode.IDENTIFY)
         self.assertEqual(flags, 0x00)
         self.assertEqual(command_id, 123)
@@ -98,12 +121,20 @@ class TestNVMeCommand(unittest.TestCase):
         """Test NVMe command packing with defaults."""
         cmd = pack_nvme_command(NVMeOpcode.FLUSH, 0x01, 456)
 
-        opcode, flags, command_id, nsid = struct.unpack('<BBHI', cmd[:8])
+        opcode, flags, command_id, nsid = _COMMAND_HEAD_STRUCT.unpack_from(cmd)
         self.assertEqual(opcode, NVMeOpcode.FLUSH)
         self.assertEqual(flags, 0x01)
         self.assertEqual(command_id, 456)
         self.assertEqual(nsid, 0)  # Default namespace
 
+    def test_pack_nvme_data_command(self):
+        """Test in-capsule data commands carry a Data Block with Offset SGL."""
+        cmd = pack_nvme_data_command(NVMeOpcode.SET_FEATURES, 789, 2, 16)
+
+        self.assertEqual(len(cmd), 64)
+        self.assertEqual(_COMMAND_HEAD_STRUCT.unpack_from(cmd), (NVMeOpcode.SET_FEATURES, 0x40, 789, 2))
+        self.assertEqual(struct.unpack_from('<L3xB', cmd, 32), (16, 0x01))
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions."""
@@ -112,7 +143,7 @@ class TestUtilityFunctions(unittest.TestCase):
         """Test CAP register parsing."""
         # Create sample CAP data: MQES=1023, TO=30, DSTRD=0
         cap_value = (1023 | (30 << 24))  # MQES + timeout
-        cap_data = struct.pack('<Q', cap_value)
+        cap_data = _CAP_STRUCT.pack(cap_value)
 
         result = parse_controller_capabilities(cap_data)
 
@@ -129,8 +160,8 @@ class TestUtilityFunctions(unittest.TestCase):
     def test_parse_discovery_log_page(self):
         """Test discovery log page parsing."""
         # Create minimal discovery log with no entries
-        header = struct.pack('<QQ', 123, 0)  # generation=123, num_records=0
-        log_data = header + b'\x00' * 1008  # Pad to 1024 bytes
+        header = _DISCOVERY_HEADER_STRUCT.pack(123, 0)  # generation=123, num_records=0
+        log_data = header + _DISCOVERY_ZERO_PAD  # Pad to 1024 bytes
 
         result = parse_discovery_log_page(log_data)
 
@@ -34,75 +34,68 @@ from nvmeof_client.protocol.io_commands import (
     pack_nvme_reservation_acquire_command,
     pack_nvme_reservation_release_command
 )
+from ..fixtures.mock_responses import create_reservation_report_data
+from ..fixtures.test_helpers import assert_command_structure
 
-import sys
-import os
-# Add the fixtures directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'fixtures'))
+_DW10 = struct.Struct('<L')  # Command dword 10, read in place at byte offset 40
 
-# Import test fixtures (must come after sys.path manipulation)
-from mock_responses import create_reservation_report_data  # noqa: E402
-from test_helpers import assert_command_structure  # noqa: E402
 
+class _StubPDU:
+    """Minimal PDU header stand-in; the client only reads pdu_type and flags."""
 
-class TestReservationCommandGeneration(unittest.TestCase):
-    """Test reservation command generation and structure."""
+    __slots__ = ('pdu_type', 'flags')
 
-    def test_pack_reservation_register_command(self):
-        """Test reservation register command packing."""
-        cmd = pack_nvme_reservation_register_command(
-            command_id=123, nsid=1, reservation_action=0
-        )
+    def __init__(self, pdu_type, flags=0):
+        self.pdu_type = pdu_type
+        self.flags = flags
 
-        assert_command_structure(self, cmd, NVMeOpcode.RESERVATION_REGISTER, expected_nsid=1)
 
-        # Check action field (DW10)
-        action = struct.unpack('<L', cmd[40:44])[0]
-        self.assertEqual(action & 0x7, 0)  # Register action
-
-    def test_pack_reservation_report_command(self):
-        """Test reservation report command packing."""
-        cmd = pack_nvme_reservation_report_command(
-            command_id=456, nsid=2, data_length=4096
-        )
-
-        assert_command_structure(self, cmd, NVMeOpcode.RESERVATION_REPORT, expected_nsid=2)
-
-        # Check NUMD field (DW10) - number of dwords minus 1
-        numd = struct.unpack('<L', cmd[40:44])[0]
-        self.assertEqual(numd, (4096 // 4) - 1)
-
-    def test_pack_reservation_acquire_command(self):
-        """Test reservation acquire command packing."""
-        cmd = pack_nvme_reservation_acquire_command(
-            command_id=789, nsid=3, reservation_action=ReservationAction.ACQUIRE,
-            reservation_type=ReservationType.WRITE_EXCLUSIVE
-        )
-
-        assert_command_structure(self, cmd, NVMeOpcode.RESERVATION_ACQUIRE, expected_nsid=3)
-
-        # Check action and type fields (DW10)
-        dw10 = struct.unpack('<L', cmd[40:44])[0]
-        action = dw10 & 0x7
-        rtype = (dw10 >> 8) & 0xFF
-        self.assertEqual(action, ReservationAction.ACQUIRE.value)  # Acquire action
-        self.assertEqual(rtype, ReservationType.WRITE_EXCLUSIVE.value)   # Write Exclusive
-
-    def test_pack_reservation_release_command(self):
-        """Test reservation release command packing."""
-        cmd = pack_nvme_reservation_release_command(
-            command_id=1234, nsid=4, reservation_action=ReservationAction.RELEASE,
-            reservation_type=ReservationType.EXCLUSIVE_ACCESS
-        )
-
-        assert_command_structure(self, cmd, NVMeOpcode.RESERVATION_RELEASE, expected_nsid=4)
+class TestReservationCommandGeneration(unittest.TestCase):
+    """Test reservation command generation and structure."""
 
-        # Check action and type fields (DW10)
-        dw10 = struct.unpack('<L', cmd[40:44])[0]
-        action = dw10 & 0x7
-        rtype = (dw10 >> 8) & 0xFF
-        self.assertEqual(action, ReservationAction.RELEASE.value)  # Release action
-        self.assertEqual(rtype, ReservationType.EXCLUSIVE_ACCESS.value)   # Exclusive Access
+    # (pack function, kwargs, expected opcode, expected 64-byte command)
+    # Golden commands: DW0 opcode/flags/CID, DW1 NSID, DW8-9 SGL length and type,
+    # DW10 action (bits 2:0) and type (bits 15:8), or NUMD and DW11 EDS for Report
+    PACK_CASES = (
+        (pack_nvme_reservation_register_command,
+         {'command_id': 123, 'nsid': 1, 'reservation_action': ReservationAction.REGISTER},
+         NVMeOpcode.RESERVATION_REGISTER,
+         bytes.fromhex('0d407b00 01000000 00000000 00000000 00000000 00000000 00000000 00000000'
+                       '10000000 00000001 00000000 00000000 00000000 00000000 00000000 00000000')),
+        (pack_nvme_reservation_report_command,
+         {'command_id': 456, 'nsid': 2, 'data_length': 4096},
+         NVMeOpcode.RESERVATION_REPORT,
+         bytes.fromhex('0e40c801 02000000 00000000 00000000 00000000 00000000 00000000 00000000'
+                       '00100000 0000005a ff030000 01000000 00000000 00000000 00000000 00000000')),
+        (pack_nvme_reservation_acquire_command,
+         {'command_id': 789, 'nsid': 3, 'reservation_action': ReservationAction.ACQUIRE,
+          'reservation_type': ReservationType.WRITE_EXCLUSIVE},
+         NVMeOpcode.RESERVATION_ACQUIRE,
+         bytes.fromhex('11401503 03000000 00000000 00000000 00000000 00000000 00000000 00000000'
+                       '10000000 00000001 00010000 00000000 00000000 00000000 00000000 00000000')),
+        (pack_nvme_reservation_release_command,
+         {'command_id': 1234, 'nsid': 4, 'reservation_action': ReservationAction.RELEASE,
+          'reservation_type': ReservationType.EXCLUSIVE_ACCESS},
+         NVMeOpcode.RESERVATION_RELEASE,
+         bytes.fromhex('1540d204 04000000 00000000 00000000 00000000 00000000 00000000 00000000'
+                       '08000000 00000001 00020000 00000000 00000000 00000000 00000000 00000000')),
+    )
+
+    def test_pack_reservation_commands(self):
+        """Test reservation register/report/acquire/release command packing."""
+        for pack_fn, kwargs, opcode, expected_cmd in self.PACK_CASES:
+            with self.subTest(pack_fn=pack_fn.__name__):
+                cmd = pack_fn(**kwargs)
+
+                assert_command_structure(self, cmd, opcode, expected_nsid=kwargs['nsid'])
+                self.assertEqual(cmd, expected_cmd)
+
+    def test_pack_reservation_commands_accept_plain_ints(self):
+        """Acquire/release packing accepts plain int action and type values."""
+        for pack_fn in (pack_nvme_reservation_acquire_command, pack_nvme_reservation_release_command):
+            with self.subTest(pack_fn=pack_fn.__name__):
+                cmd = pack_fn(command_id=1, nsid=1, reservation_action=1, reservation_type=3)
+                self.assertEqual(_DW10.unpack_from(cmd, 40)[0], 1 | (3 << 8))
 
 
 class TestReservationModels(unittest.TestCase):
@@ -215,6 +208,10 @@ class TestReservationMethodParameterValidation(unittest.TestCase):
         # Invalid action
         with self.assertRaises(ValueError):
             self.client.reservation_acquire(1, 99, ReservationType.WRITE_EXCLUSIVE, 0x123)
+        with self.assertRaises(ValueError):
+            self.client.reservation_acquire(1, -1, ReservationType.WRITE_EXCLUSIVE, 0x123)
+        with self.assertRaises(ValueError):
+            self.client.reservation_acquire(1, None, ReservationType.WRITE_EXCLUSIVE, 0x123)
 
         # Invalid reservation type
         with self.assertRaises(ValueError):
@@ -239,6 +236,8 @@ class TestReservationMethodParameterValidation(unittest.TestCase):
         # Invalid reservation type
         with self.assertRaises(ValueError):
             self.client.reservation_release(1, ReservationAction.RELEASE, 99, 0x123)
+        with self.assertRaises(ValueError):
+            self.client.reservation_release(1, ReservationAction.RELEASE, 1.0, 0x123)
 
     def test_connection_state_validation(self):
         """Test that reservation methods check connection state."""
@@ -283,12 +282,28 @@ class TestReservationMethodParameterValidation(unittest.TestCase):
 class TestReservationMethodMockedExecution(unittest.TestCase):
     """Test reservation methods with mocked socket responses."""
 
+    # PDU headers handed out by the mocked receive path; the client only reads them
+    RSP_PDU = _StubPDU(PDUType.RSP)
+    C2H_DATA_PDU = _StubPDU(PDUType.C2H_DATA)
+    H2C_DATA_PDU = _StubPDU(PDUType.H2C_DATA)
+
+    # Extended-format report shared by the report tests: controller 1 holds a
+    # Write Exclusive reservation, controllers 1 and 2 are registered
+    REPORT_DATA = create_reservation_report_data(
+        generation=123,
+        reservation_type=ReservationType.WRITE_EXCLUSIVE,
+        reservation_holder=1,
+        registered_controllers=[(1, 0x1111), (2, 0x2222)],
+        extended_format=True
+    )
+
     def setUp(self):
         """Set up test client with mocked dependencies."""
         self.client = NVMeoFClient("localhost", port=4420)
         self.client._connected = True
         self.client._is_discovery_subsystem = False
         self.client._command_id_counter = 0
+        self.client._controller_id = 7
 
         # Mock I/O socket and queue setup
         self.client._io_socket = Mock()
@@ -302,7 +317,7 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         """Test successful reservation register operation."""
         # Mock successful response
         mock_parse.return_value = {'status': 0}
-        mock_receive.return_value = (Mock(pdu_type=PDUType.RSP), b'response_data')
+        mock_receive.return_value = (self.RSP_PDU, b'response_data')
 
         result = self.client.reservation_register(
             1, ReservationAction.REGISTER, 0x123456789ABCDEF0)
@@ -317,25 +332,17 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertEqual(result.reservation_key, 0x123456789ABCDEF0)
         self.assertEqual(result.status_code, 0)
+        self.assertEqual(result.controller_id, 7)
 
     @patch('nvmeof_client.client.NVMeoFClient._send_nvme_io_command_pdu')
     @patch('nvmeof_client.client.NVMeoFClient._receive_pdu_on_socket')
     @patch('nvmeof_client.parsers.response.ResponseParser.parse_response')
     def test_reservation_report_success(self, mock_parse, mock_receive, mock_send):
         """Test successful reservation report operation."""
-        # Create mock reservation report data (extended format)
-        report_data = create_reservation_report_data(
-            generation=123,
-            reservation_type=ReservationType.WRITE_EXCLUSIVE.value,
-            reservation_holder=1,  # Controller 1 holds the reservation
-            registered_controllers=[(1, 0x1111), (2, 0x2222)],
-            extended_format=True
-        )
-
         # Mock responses: data first, then completion
         mock_receive.side_effect = [
-            (Mock(pdu_type=PDUType.C2H_DATA, flags=0), report_data),
-            (Mock(pdu_type=PDUType.RSP), b'response_data')
+            (self.C2H_DATA_PDU, self.REPORT_DATA),
+            (self.RSP_PDU, b'response_data')
         ]
         mock_parse.return_value = {'status': 0}
 
@@ -354,6 +361,24 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         self.assertEqual(len(result.registered_controllers), 2)
         self.assertEqual(result.reservation_keys[1], 0x1111)
 
+    @patch('nvmeof_client.client.NVMeoFClient._send_nvme_io_command_pdu')
+    @patch('nvmeof_client.client.NVMeoFClient._receive_pdu_on_socket')
+    @patch('nvmeof_client.parsers.response.ResponseParser.parse_response')
+    def test_reservation_report_key_filter(self, mock_parse, mock_receive, mock_send):
+        """Test reservation report filtered to a single reservation key."""
+        mock_receive.side_effect = [
+            (self.C2H_DATA_PDU, self.REPORT_DATA),
+            (self.RSP_PDU, b'response_data')
+        ]
+        mock_parse.return_value = {'status': 0}
+
+        result = self.client.reservation_report(1, key_filter=0x2222)
+
+        self.assertEqual(result.registered_controllers, [2])
+        self.assertEqual(result.reservation_keys, {2: 0x2222})
+        # Holder is reported even though its key does not match the filter
+        self.assertEqual(result.reservation_holder, 1)
+
     @patch('nvmeof_client.client.NVMeoFClient._send_nvme_reservation_pdu')
     @patch('nvmeof_client.client.NVMeoFClient._receive_pdu_on_socket')
     @patch('nvmeof_client.parsers.response.ResponseParser.parse_response')
@@ -361,7 +386,7 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         """Test successful reservation acquire operation."""
         # Mock successful response
         mock_parse.return_value = {'status': 0}
-        mock_receive.return_value = (Mock(pdu_type=PDUType.RSP), b'response_data')
+        mock_receive.return_value = (self.RSP_PDU, b'response_data')
 
         result = self.client.reservation_acquire(
             1, ReservationAction.ACQUIRE, ReservationType.WRITE_EXCLUSIVE,
@@ -384,7 +409,7 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         """Test successful reservation release operation."""
         # Mock successful response
         mock_parse.return_value = {'status': 0}
-        mock_receive.return_value = (Mock(pdu_type=PDUType.RSP), b'response_data')
+        mock_receive.return_value = (self.RSP_PDU, b'response_data')
 
         result = self.client.reservation_release(
             1, ReservationAction.RELEASE, ReservationType.WRITE_EXCLUSIVE,
@@ -407,7 +432,7 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
         """Test reservation command failure handling."""
         # Mock command failure
         mock_parse.return_value = {'status': 0x18}  # Reservation conflict
-        mock_receive.return_value = (Mock(pdu_type=PDUType.RSP), b'response_data')
+        mock_receive.return_value = (self.RSP_PDU, b'response_data')
 
         with self.assertRaises(CommandError) as cm:
             self.client.reservation_register(1, ReservationAction.REGISTER, 0x123)
@@ -419,7 +444,7 @@ class TestReservationMethodMockedExecution(unittest.TestCase):
     def test_reservation_report_protocol_error(self, mock_receive, mock_send):
         """Test reservation report protocol error handling."""
         # Mock unexpected PDU type (e.g., H2C_DATA when we expect C2H_DATA)
-        mock_receive.return_value = (Mock(pdu_type=PDUType.H2C_DATA), b'unexpected_data')
+        mock_receive.return_value = (self.H2C_DATA_PDU, b'unexpected_data')
 
         with self.assertRaises(ProtocolError) as cm:
             self.client.reservation_report(1)